@@ -100,6 +100,7 @@ setup(
             "line-profiler>=4.0.0",
             "py-spy>=0.3.14",
             "locust>=2.17.0",
+            "numba>=0.59.0",
         ],
         "monitoring": [
             "prometheus-client>=0.17.0",
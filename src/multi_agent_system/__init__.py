@@ -5,35 +5,67 @@ This package implements a multi-agent system for analyzing climate risks using
 Google's ADK and A2A SDK, with support for various data sources and analysis tools.
 """
 
-from .adk_integration import ADKAgentCardManager, ADKAgentCoordinator, ADKClient
-from .agent_team import AgentTeam
-from .agents import (
-    FarewellAgent,
-    GreetingAgent,
-    HistoricalAnalyzerAgent,
-    NewsMonitoringAgent,
-    RecommendationAgent,
-    RiskAnalyzerAgent,
-    ValidationAgent,
-)
-from .agents.base_agent import BaseAgent
-from .artifact_manager import ArtifactManager
-from .communication import CommunicationManager
-from .coordinator import CoordinatorAgent
-from .data import DataSource, NOAAWeatherData, get_weather_data
-from .observability import ObservabilityManager
-from .risk_definitions import RiskLevel, RiskType, get_consensus_thresholds
-from .session_manager import AgentState, AnalysisSession
-from .weather_risks import ClimateRiskAnalyzer
-from .workflows import (
-    LoopWorkflow,
-    ParallelWorkflow,
-    SequentialWorkflow,
-    WorkflowContext,
-    WorkflowManager,
-    WorkflowState,
-    WorkflowStep,
-)
+import importlib
+
+# Public names resolved on first attribute access (PEP 562) so that
+# ``import multi_agent_system`` does not pull in the ADK / Vertex AI client
+# and every agent module up front.
+_LAZY: dict[str, str] = {
+    # Agents
+    'BaseAgent': '.agents.base_agent',
+    'GreetingAgent': '.agents',
+    'FarewellAgent': '.agents',
+    'RecommendationAgent': '.agents',
+    'ValidationAgent': '.agents',
+    'HistoricalAnalyzerAgent': '.agents',
+    'RiskAnalyzerAgent': '.agents',
+    'NewsMonitoringAgent': '.agents',
+
+    # Data
+    'NOAAWeatherData': '.data',
+    'get_weather_data': '.data',
+    'DataSource': '.data',
+
+    # Workflows
+    'SequentialWorkflow': '.workflows',
+    'ParallelWorkflow': '.workflows',
+    'LoopWorkflow': '.workflows',
+    'WorkflowManager': '.workflows',
+    'WorkflowStep': '.workflows',
+    'WorkflowState': '.workflows',
+    'WorkflowContext': '.workflows',
+
+    # Core Components
+    'CoordinatorAgent': '.coordinator',
+    'CommunicationManager': '.communication',
+    'AnalysisSession': '.session_manager',
+    'AgentState': '.session_manager',
+    'AgentTeam': '.agent_team',
+    'ADKAgentCardManager': '.adk_integration',
+    'ADKAgentCoordinator': '.adk_integration',
+    'ADKClient': '.adk_integration',
+    'ObservabilityManager': '.observability',
+    'RiskType': '.risk_definitions',
+    'RiskLevel': '.risk_definitions',
+    'get_consensus_thresholds': '.risk_definitions',
+    'ArtifactManager': '.artifact_manager',
+    'ClimateRiskAnalyzer': '.weather_risks',
+}
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     # Agents
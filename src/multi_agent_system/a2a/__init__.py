@@ -6,41 +6,59 @@ for multi-agent communication, including message structure, part types,
 artifact management, and task management.
 """
 
-from .artifact_manager import A2AArtifactManager, artifact_manager
-from .artifacts import (
-    A2AArtifact,
-    ArtifactMetadata,
-    ArtifactPriority,
-    ArtifactStatus,
-    ArtifactType,
-    ArtifactVersion,
-    create_artifact,
-    create_recommendation_artifact,
-    create_report_artifact,
-    create_visualization_artifact,
-)
-from .enums import MessageType, PartType, StatusCode
-from .message import (
-    A2AMessage,
-    A2AMessageHeaders,
-    A2AMessagePart,
-    create_data_message,
-    create_error_message,
-    create_multipart_message,
-    create_request_message,
-    create_response_message,
-    create_text_message,
-)
-from .multipart import A2AMultiPartMessage
-from .parts import (
-    A2APart,
-    create_binary_part,
-    create_data_part,
-    create_file_part,
-    create_text_part,
-)
-from .router import A2AMessageRouter
-from .task_manager import TaskManager, task_manager
+import importlib
+
+# The manager singletons share their names with the submodules that define
+# them, so they are bound eagerly; a lazy lookup would be shadowed by the
+# submodule object once ``a2a.artifact_manager`` or ``a2a.task_manager`` is
+# imported directly.
+from .artifact_manager import artifact_manager
+from .task_manager import task_manager
+
+# Everything else is resolved on first attribute access (PEP 562).
+_LAZY: dict[str, str] = {
+    # Enums
+    'StatusCode': '.enums', 'MessageType': '.enums', 'PartType': '.enums',
+
+    # Messages
+    'A2AMessage': '.message', 'A2AMessageHeaders': '.message', 'A2AMessagePart': '.message',
+    'A2AMultiPartMessage': '.multipart',
+    'create_request_message': '.message', 'create_response_message': '.message',
+    'create_error_message': '.message', 'create_text_message': '.message',
+    'create_data_message': '.message', 'create_multipart_message': '.message',
+
+    # Parts
+    'A2APart': '.parts', 'create_text_part': '.parts', 'create_data_part': '.parts',
+    'create_file_part': '.parts', 'create_binary_part': '.parts',
+
+    # Router
+    'A2AMessageRouter': '.router',
+
+    # Artifacts
+    'A2AArtifact': '.artifacts', 'ArtifactMetadata': '.artifacts',
+    'ArtifactPriority': '.artifacts', 'ArtifactStatus': '.artifacts',
+    'ArtifactType': '.artifacts', 'ArtifactVersion': '.artifacts',
+    'create_artifact': '.artifacts', 'create_recommendation_artifact': '.artifacts',
+    'create_report_artifact': '.artifacts', 'create_visualization_artifact': '.artifacts',
+
+    # Managers
+    'A2AArtifactManager': '.artifact_manager', 'TaskManager': '.task_manager',
+}
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     # Enums
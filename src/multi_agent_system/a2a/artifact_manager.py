@@ -5,13 +5,18 @@ Manages A2A artifact storage, retrieval, and lifecycle operations.
 """
 
 import json
+import logging
 import shutil
 import sqlite3
+import threading
+from collections import Counter, OrderedDict
 from contextlib import contextmanager
-from datetime import datetime
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from .artifacts import (
     A2AArtifact,
     ArtifactMetadata,
@@ -21,6 +26,22 @@ from .artifacts import (
     ArtifactVersion,
 )
 
+logger = logging.getLogger(__name__)
+
+# Applied to the manager's shared connection when it is opened
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # 64 MiB
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+)
+
+# Prepared statements kept per connection. search_artifacts builds IN (...)
+# lists of varying length, so leave headroom above the default of 128 for
+# the fixed store/retrieve statements to stay prepared.
+SQLITE_STATEMENT_CACHE_SIZE = 512
+
 
 class ArtifactStorageError(Exception):
     """Raised when artifact storage operations fail."""
@@ -46,16 +67,22 @@ class A2AArtifactManager:
         self.db_path = Path(db_path)
         self.storage_path.mkdir(exist_ok=True)
 
+        # One long-lived connection shared by all operations
+        self._conn: sqlite3.Connection | None = None
+        self._conn_lock = threading.RLock()
+        self._conn_depth = 0
+
         # Initialize database
         self._init_database()
 
-        # Cache for frequently accessed artifacts
-        self._cache: dict[str, A2AArtifact] = {}
+        # LRU cache of recently accessed artifacts, least recent first;
+        # guarded by _conn_lock like the connection
+        self._cache: OrderedDict[str, A2AArtifact] = OrderedDict()
         self._cache_size = 100
 
     def _init_database(self):
         """Initialize SQLite database for artifact metadata."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._get_db_connection() as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS artifacts (
                     id TEXT PRIMARY KEY,
@@ -104,26 +131,124 @@ class A2AArtifactManager:
                 )
             """)
 
-            # Create indexes for performance
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_artifacts_type ON artifacts(artifact_type)")
+            # One row per (tag, artifact) so tag filters are index lookups
+            # instead of substring scans over the JSON tags column
+            has_tag_table = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'artifact_tags'"
+            ).fetchone()
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS artifact_tags (
+                    artifact_id TEXT NOT NULL,
+                    tag TEXT NOT NULL,
+                    PRIMARY KEY (tag, artifact_id),
+                    FOREIGN KEY (artifact_id) REFERENCES artifacts (id)
+                )
+            """)
+            if not has_tag_table:
+                # Backfill from databases created before the table existed
+                conn.execute("""
+                    INSERT OR IGNORE INTO artifact_tags (artifact_id, tag)
+                    SELECT artifacts.id, json_each.value
+                    FROM artifacts, json_each(artifacts.tags)
+                    WHERE artifacts.tags IS NOT NULL
+                """)
+
+            # Create indexes for performance. The composite indexes match the
+            # search_artifacts filters plus its ORDER BY created_at DESC, so
+            # filtered, limited searches need no separate sort.
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_artifacts_type_status_created
+                ON artifacts(artifact_type, status, created_at DESC)
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_artifacts_author_created
+                ON artifacts(author, created_at DESC)
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_artifacts_expires
+                ON artifacts(expires_at) WHERE expires_at IS NOT NULL
+            """)
             conn.execute("CREATE INDEX IF NOT EXISTS idx_artifacts_status ON artifacts(status)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_artifacts_author ON artifacts(author)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_artifacts_created ON artifacts(created_at)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_artifacts_tags ON artifacts(tags)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_artifact_tags_artifact ON artifact_tags(artifact_id)")
+            # Superseded by artifact_tags and the composite indexes above
+            for index in ("idx_artifacts_tags", "idx_artifacts_type", "idx_artifacts_author"):
+                conn.execute(f"DROP INDEX IF EXISTS {index}")
+            conn.commit()
 
     @contextmanager
     def _get_db_connection(self):
-        """Get database connection with proper error handling."""
-        conn = None
-        try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            yield conn
-        except sqlite3.Error as e:
-            raise ArtifactStorageError(f"Database error: {e}")
-        finally:
-            if conn:
-                conn.close()
+        """Get the shared database connection with proper error handling.
+
+        The connection is opened on first use and kept for the lifetime of
+        the manager; the lock serializes access across threads. Only the
+        outermost caller rolls back on failure, so a nested call that fails
+        does not discard an enclosing transaction.
+        """
+        with self._conn_lock:
+            outermost = self._conn_depth == 0
+            self._conn_depth += 1
+            try:
+                if self._conn is None:
+                    conn = sqlite3.connect(
+                        self.db_path,
+                        check_same_thread=False,
+                        cached_statements=SQLITE_STATEMENT_CACHE_SIZE
+                    )
+                    conn.row_factory = sqlite3.Row
+                    for pragma in SQLITE_PRAGMAS:
+                        conn.execute(pragma)
+                    self._conn = conn
+                yield self._conn
+            except sqlite3.Error as e:
+                if outermost:
+                    self._rollback()
+                raise ArtifactStorageError(f"Database error: {e}")
+            except BaseException:
+                if outermost:
+                    self._rollback()
+                raise
+            finally:
+                self._conn_depth -= 1
+
+    def _rollback(self):
+        """Discard any uncommitted work left on the shared connection."""
+        if self._conn is not None and self._conn.in_transaction:
+            self._conn.rollback()
+
+    @contextmanager
+    def _transaction(self):
+        """Run the enclosed writes as one transaction.
+
+        Nested use (e.g. store_artifact inside import_artifacts) joins the
+        enclosing transaction through a savepoint, so a bulk operation
+        commits once while a failed inner write is still undone on its own.
+        """
+        with self._get_db_connection() as conn:
+            if conn.in_transaction:
+                conn.execute("SAVEPOINT artifact_write")
+                try:
+                    yield conn
+                except BaseException:
+                    conn.execute("ROLLBACK TO artifact_write")
+                    conn.execute("RELEASE artifact_write")
+                    raise
+                conn.execute("RELEASE artifact_write")
+            else:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    yield conn
+                except BaseException:
+                    conn.rollback()
+                    raise
+                conn.commit()
+
+    def close(self):
+        """Close the shared database connection."""
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
     def store_artifact(self, artifact: A2AArtifact) -> str:
         """Store an artifact in the system."""
@@ -136,8 +261,9 @@ class A2AArtifactManager:
             # Store content file
             content_path = self._store_content(artifact)
 
-            # Store metadata in database
-            with self._get_db_connection() as conn:
+            # Store metadata, versions and permissions in one transaction
+            granted_at = datetime.utcnow().isoformat()
+            with self._transaction() as conn:
                 conn.execute("""
                     INSERT OR REPLACE INTO artifacts (
                         id, artifact_type, status, priority, title, description,
@@ -165,12 +291,12 @@ class A2AArtifactManager:
                 ))
 
                 # Store versions
-                for version in artifact.versions:
-                    conn.execute("""
-                        INSERT OR REPLACE INTO artifact_versions (
-                            artifact_id, version, created_at, author, changes, content_hash, size
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """, (
+                conn.executemany("""
+                    INSERT OR REPLACE INTO artifact_versions (
+                        artifact_id, version, created_at, author, changes, content_hash, size
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, [
+                    (
                         artifact.id,
                         version.version,
                         version.created_at.isoformat(),
@@ -178,23 +304,32 @@ class A2AArtifactManager:
                         json.dumps(version.changes),
                         version.content_hash,
                         version.size
-                    ))
+                    )
+                    for version in artifact.versions
+                ])
 
                 # Store permissions
-                for user_id, permissions in artifact.permissions.items():
-                    conn.execute("""
-                        INSERT OR REPLACE INTO artifact_permissions (
-                            artifact_id, user_id, permissions, granted_at, granted_by
-                        ) VALUES (?, ?, ?, ?, ?)
-                    """, (
+                conn.executemany("""
+                    INSERT OR REPLACE INTO artifact_permissions (
+                        artifact_id, user_id, permissions, granted_at, granted_by
+                    ) VALUES (?, ?, ?, ?, ?)
+                """, [
+                    (
                         artifact.id,
                         user_id,
                         json.dumps(permissions),
-                        datetime.utcnow().isoformat(),
+                        granted_at,
                         artifact.metadata.author
-                    ))
-
-                conn.commit()
+                    )
+                    for user_id, permissions in artifact.permissions.items()
+                ])
+
+                # Store tags
+                conn.execute("DELETE FROM artifact_tags WHERE artifact_id = ?", (artifact.id,))
+                conn.executemany(
+                    "INSERT OR IGNORE INTO artifact_tags (artifact_id, tag) VALUES (?, ?)",
+                    [(artifact.id, tag) for tag in artifact.metadata.tags]
+                )
 
             # Update cache
             self._update_cache(artifact)
@@ -205,7 +340,11 @@ class A2AArtifactManager:
             raise ArtifactStorageError(f"Failed to store artifact: {e}")
 
     def _store_content(self, artifact: A2AArtifact) -> str:
-        """Store artifact content to file system."""
+        """Store artifact content to file system.
+
+        Returns the content path relative to ``storage_path``, which is how
+        retrieval resolves it.
+        """
         try:
             # Create artifact directory
             artifact_dir = self.storage_path / artifact.id
@@ -214,26 +353,15 @@ class A2AArtifactManager:
             # Store content based on artifact type
             content_path = artifact_dir / f"content.{self._get_file_extension(artifact.artifact_type)}"
 
-            if artifact.artifact_type == ArtifactType.REPORT:
-                with open(content_path, 'w', encoding='utf-8') as f:
-                    json.dump(artifact.content, f, indent=2)
-            elif artifact.artifact_type == ArtifactType.RECOMMENDATION:
-                with open(content_path, 'w', encoding='utf-8') as f:
-                    json.dump(artifact.content, f, indent=2)
-            elif artifact.artifact_type == ArtifactType.VISUALIZATION:
-                # For visualizations, content might be binary
-                if isinstance(artifact.content, bytes):
-                    with open(content_path, 'wb') as f:
-                        f.write(artifact.content)
-                else:
-                    with open(content_path, 'w', encoding='utf-8') as f:
-                        json.dump(artifact.content, f, indent=2)
+            if artifact.artifact_type == ArtifactType.VISUALIZATION and isinstance(artifact.content, bytes):
+                # Visualizations may carry raw image bytes
+                payload = artifact.content
             else:
-                # Default to JSON storage
-                with open(content_path, 'w', encoding='utf-8') as f:
-                    json.dump(artifact.content, f, indent=2)
+                # Compact JSON serialized straight to bytes
+                payload = orjson.dumps(artifact.content, option=orjson.OPT_NON_STR_KEYS)
+            content_path.write_bytes(payload)
 
-            return str(content_path)
+            return str(content_path.relative_to(self.storage_path))
 
         except Exception as e:
             raise ArtifactStorageError(f"Failed to store artifact content: {e}")
@@ -244,19 +372,19 @@ class A2AArtifactManager:
             ArtifactType.REPORT: "json",
             ArtifactType.RECOMMENDATION: "json",
             ArtifactType.VISUALIZATION: "png",
-            ArtifactType.DATA: "json",
-            ArtifactType.MODEL: "pkl",
-            ArtifactType.DOCUMENT: "md"
+            ArtifactType.DATA_EXPORT: "json",
         }
         return extensions.get(artifact_type, "json")
 
     def retrieve_artifact(self, artifact_id: str, user_id: str | None = None) -> A2AArtifact:
         """Retrieve an artifact by ID."""
         # Check cache first
-        if artifact_id in self._cache:
-            artifact = self._cache[artifact_id]
-            artifact.access(user_id or "unknown")
-            return artifact
+        with self._conn_lock:
+            artifact = self._cache.get(artifact_id)
+            if artifact is not None:
+                self._cache.move_to_end(artifact_id)
+                artifact.access(user_id or "unknown")
+                return artifact
 
         try:
             with self._get_db_connection() as conn:
@@ -272,69 +400,18 @@ class A2AArtifactManager:
                 if user_id:
                     self._check_permissions(conn, artifact_id, user_id)
 
-                # Load content
-                content_path = self.storage_path / row['content_path']
-                content = self._load_content(content_path, row['artifact_type'])
-
-                # Create metadata
-                metadata = ArtifactMetadata(
-                    title=row['title'],
-                    description=row['description'],
-                    author=row['author'],
-                    created_at=datetime.fromisoformat(row['created_at']),
-                    modified_at=datetime.fromisoformat(row['modified_at']),
-                    accessed_at=datetime.fromisoformat(row['accessed_at']) if row['accessed_at'] else None,
-                    tags=json.loads(row['tags']) if row['tags'] else [],
-                    custom_fields=json.loads(row['custom_fields']) if row['custom_fields'] else {}
-                )
-
-                # Load versions
-                versions = []
                 version_rows = conn.execute("""
                     SELECT * FROM artifact_versions WHERE artifact_id = ? ORDER BY created_at
                 """, (artifact_id,)).fetchall()
-
-                for v_row in version_rows:
-                    version = ArtifactVersion(
-                        version=v_row['version'],
-                        created_at=datetime.fromisoformat(v_row['created_at']),
-                        author=v_row['author'],
-                        changes=json.loads(v_row['changes']) if v_row['changes'] else [],
-                        content_hash=v_row['content_hash'],
-                        size=v_row['size']
-                    )
-                    versions.append(version)
-
-                # Load permissions
-                permissions = {}
                 perm_rows = conn.execute("""
                     SELECT user_id, permissions FROM artifact_permissions WHERE artifact_id = ?
                 """, (artifact_id,)).fetchall()
 
-                for p_row in perm_rows:
-                    permissions[p_row['user_id']] = json.loads(p_row['permissions'])
-
-                # Create artifact
-                artifact = A2AArtifact(
-                    id=artifact_id,
-                    artifact_type=ArtifactType(row['artifact_type']),
-                    status=ArtifactStatus(row['status']),
-                    priority=ArtifactPriority(row['priority']),
-                    content=content,
-                    metadata=metadata,
-                    versions=versions,
-                    current_version=row['current_version'],
-                    access_count=row['access_count'],
-                    quality_score=row['quality_score'],
-                    permissions=permissions
-                )
-
-                if row['expires_at']:
-                    artifact.expires_at = datetime.fromisoformat(row['expires_at'])
+                artifact = self._build_artifact(row, version_rows, perm_rows)
 
-                # Update access count
+                # Update access count without rewriting the artifact
                 artifact.access(user_id or "unknown")
-                self.store_artifact(artifact)
+                self._record_access([artifact_id], artifact.metadata.accessed_at)
 
                 # Update cache
                 self._update_cache(artifact)
@@ -346,6 +423,68 @@ class A2AArtifactManager:
         except Exception as e:
             raise ArtifactStorageError(f"Failed to retrieve artifact: {e}")
 
+    def _record_access(self, artifact_ids: list[str], accessed_at: datetime):
+        """Bump access_count and accessed_at for the given artifacts in place."""
+        with self._transaction() as conn:
+            conn.execute(f"""
+                UPDATE artifacts SET access_count = access_count + 1, accessed_at = ?
+                WHERE id IN ({", ".join("?" * len(artifact_ids))})
+            """, [accessed_at.isoformat(), *artifact_ids])
+
+    def _build_artifact(
+        self,
+        row: sqlite3.Row,
+        version_rows: list[sqlite3.Row],
+        perm_rows: list[sqlite3.Row]
+    ) -> A2AArtifact:
+        """Rebuild an artifact from its database rows and stored content."""
+        content_path = self.storage_path / row['content_path']
+        content = self._load_content(content_path, row['artifact_type'])
+
+        metadata = ArtifactMetadata(
+            title=row['title'],
+            description=row['description'],
+            author=row['author'],
+            created_at=datetime.fromisoformat(row['created_at']),
+            modified_at=datetime.fromisoformat(row['modified_at']),
+            accessed_at=datetime.fromisoformat(row['accessed_at']) if row['accessed_at'] else None,
+            tags=json.loads(row['tags']) if row['tags'] else [],
+            custom_fields=json.loads(row['custom_fields']) if row['custom_fields'] else {}
+        )
+
+        versions = [
+            ArtifactVersion(
+                version=v_row['version'],
+                created_at=datetime.fromisoformat(v_row['created_at']),
+                author=v_row['author'],
+                changes=json.loads(v_row['changes']) if v_row['changes'] else [],
+                content_hash=v_row['content_hash'],
+                size=v_row['size']
+            )
+            for v_row in version_rows
+        ]
+
+        permissions = {p_row['user_id']: json.loads(p_row['permissions']) for p_row in perm_rows}
+
+        artifact = A2AArtifact(
+            id=row['id'],
+            artifact_type=ArtifactType(row['artifact_type']),
+            status=ArtifactStatus(row['status']),
+            priority=ArtifactPriority(row['priority']),
+            content=content,
+            metadata=metadata,
+            versions=versions,
+            current_version=row['current_version'],
+            access_count=row['access_count'],
+            quality_score=row['quality_score'],
+            permissions=permissions
+        )
+
+        if row['expires_at']:
+            artifact.expires_at = datetime.fromisoformat(row['expires_at'])
+
+        return artifact
+
     def _load_content(self, content_path: Path, artifact_type: str) -> str | dict[str, Any] | bytes:
         """Load content from file system."""
         try:
@@ -353,18 +492,16 @@ class A2AArtifactManager:
                 raise ArtifactNotFoundError(f"Content file not found: {content_path}")
 
             # Load content based on artifact type
+            raw = content_path.read_bytes()
             if artifact_type == ArtifactType.VISUALIZATION.value:
-                # Load as binary for visualizations
-                with open(content_path, 'rb') as f:
-                    return f.read()
-            else:
-                # Load as text/JSON for other types
-                with open(content_path, encoding='utf-8') as f:
-                    content = f.read()
-                    try:
-                        return json.loads(content)
-                    except json.JSONDecodeError:
-                        return content
+                # Binary for visualizations
+                return raw
+
+            # JSON for other types, falling back to plain text
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                return raw.decode('utf-8')
 
         except Exception as e:
             raise ArtifactStorageError(f"Failed to load artifact content: {e}")
@@ -400,7 +537,7 @@ class A2AArtifactManager:
     ) -> list[A2AArtifact]:
         """Search artifacts with filters."""
         try:
-            query = "SELECT id FROM artifacts WHERE 1=1"
+            query = "SELECT * FROM artifacts WHERE 1=1"
             params = []
 
             if artifact_type:
@@ -417,8 +554,8 @@ class A2AArtifactManager:
 
             if tags:
                 for tag in tags:
-                    query += " AND tags LIKE ?"
-                    params.append(f'%"{tag}"%')
+                    query += " AND id IN (SELECT artifact_id FROM artifact_tags WHERE tag = ?)"
+                    params.append(tag)
 
             if created_after:
                 query += " AND created_at >= ?"
@@ -433,15 +570,45 @@ class A2AArtifactManager:
 
             with self._get_db_connection() as conn:
                 rows = conn.execute(query, params).fetchall()
-
+                if not rows:
+                    return []
+
+                # Fetch versions and permissions for every hit in one query each
+                ids = [row['id'] for row in rows]
+                placeholders = ", ".join("?" * len(ids))
+                versions_by_id: dict[str, list[sqlite3.Row]] = {}
+                for v_row in conn.execute(f"""
+                    SELECT * FROM artifact_versions WHERE artifact_id IN ({placeholders})
+                    ORDER BY created_at
+                """, ids):
+                    versions_by_id.setdefault(v_row['artifact_id'], []).append(v_row)
+                perms_by_id: dict[str, list[sqlite3.Row]] = {}
+                for p_row in conn.execute(f"""
+                    SELECT artifact_id, user_id, permissions FROM artifact_permissions
+                    WHERE artifact_id IN ({placeholders})
+                """, ids):
+                    perms_by_id.setdefault(p_row['artifact_id'], []).append(p_row)
+
+                # One access time for the cached objects and the database rows
+                accessed_at = datetime.now(UTC)
                 artifacts = []
                 for row in rows:
                     try:
-                        artifact = self.retrieve_artifact(row['id'])
+                        artifact = self._cache.get(row['id'])
+                        if artifact is None:
+                            artifact = self._build_artifact(
+                                row, versions_by_id.get(row['id'], []), perms_by_id.get(row['id'], [])
+                            )
+                        artifact.access("unknown", accessed_at)
+                        self._update_cache(artifact)
                         artifacts.append(artifact)
                     except Exception as e:
                         # Log error but continue with other artifacts
-                        print(f"Error loading artifact {row['id']}: {e}")
+                        logger.error(f"Error loading artifact {row['id']}: {e}")
+
+                # Record the accesses with a single UPDATE
+                if artifacts:
+                    self._record_access([artifact.id for artifact in artifacts], accessed_at)
 
                 return artifacts
 
@@ -480,17 +647,41 @@ class A2AArtifactManager:
         return artifact
 
     def delete_artifact(self, artifact_id: str, user_id: str | None = None) -> bool:
-        """Delete an artifact (soft delete by default)."""
+        """Delete an artifact (soft delete by default).
+
+        Only the status and version history change, so this works on the
+        database rows and never reads or rewrites the content file.
+        """
         try:
-            artifact = self.retrieve_artifact(artifact_id, user_id)
+            with self._transaction() as conn:
+                if not conn.execute("SELECT 1 FROM artifacts WHERE id = ?", (artifact_id,)).fetchone():
+                    raise ArtifactNotFoundError(f"Artifact {artifact_id} not found")
 
-            # Soft delete - change status to deleted
-            artifact.update_status(ArtifactStatus.DELETED, user_id or "system")
-            self.store_artifact(artifact)
+                if user_id:
+                    self._check_permissions(conn, artifact_id, user_id)
 
-            # Remove from cache
-            if artifact_id in self._cache:
-                del self._cache[artifact_id]
+                # Soft delete - change status to deleted
+                conn.execute("""
+                    UPDATE artifacts SET status = ?, modified_at = ? WHERE id = ?
+                """, (ArtifactStatus.DELETED.value, datetime.now(UTC).isoformat(), artifact_id))
+
+                # Note the change on the latest version, as A2AArtifact.update_status does
+                latest = conn.execute("""
+                    SELECT version, changes FROM artifact_versions
+                    WHERE artifact_id = ? ORDER BY created_at DESC LIMIT 1
+                """, (artifact_id,)).fetchone()
+                if latest:
+                    changes = json.loads(latest['changes']) if latest['changes'] else []
+                    changes.append(f"Status changed to {ArtifactStatus.DELETED.value}")
+                    conn.execute("""
+                        UPDATE artifact_versions SET changes = ? WHERE artifact_id = ? AND version = ?
+                    """, (json.dumps(changes), artifact_id, latest['version']))
+
+            # Remove from cache, keeping any held reference consistent
+            with self._conn_lock:
+                cached = self._cache.pop(artifact_id, None)
+            if cached is not None:
+                cached.update_status(ArtifactStatus.DELETED, user_id or "system")
 
             return True
 
@@ -509,6 +700,7 @@ class A2AArtifactManager:
                 # Delete from database
                 conn.execute("DELETE FROM artifact_versions WHERE artifact_id = ?", (artifact_id,))
                 conn.execute("DELETE FROM artifact_permissions WHERE artifact_id = ?", (artifact_id,))
+                conn.execute("DELETE FROM artifact_tags WHERE artifact_id = ?", (artifact_id,))
                 conn.execute("DELETE FROM artifacts WHERE id = ?", (artifact_id,))
                 conn.commit()
 
@@ -518,8 +710,8 @@ class A2AArtifactManager:
                 shutil.rmtree(content_dir)
 
             # Remove from cache
-            if artifact_id in self._cache:
-                del self._cache[artifact_id]
+            with self._conn_lock:
+                self._cache.pop(artifact_id, None)
 
             return True
 
@@ -529,50 +721,39 @@ class A2AArtifactManager:
     def get_artifact_statistics(self) -> dict[str, Any]:
         """Get statistics about stored artifacts."""
         try:
+            # One grouped pass; size lives on the current version row
             with self._get_db_connection() as conn:
-                stats = {}
-
-                # Total artifacts
-                total = conn.execute("SELECT COUNT(*) as count FROM artifacts").fetchone()['count']
-                stats['total_artifacts'] = total
-
-                # By type
-                type_stats = conn.execute("""
-                    SELECT artifact_type, COUNT(*) as count
-                    FROM artifacts
-                    GROUP BY artifact_type
+                rows = conn.execute("""
+                    SELECT a.artifact_type, a.status, a.author,
+                           COUNT(*) AS count, COUNT(v.size) AS sized, SUM(v.size) AS total_size
+                    FROM artifacts a
+                    LEFT JOIN artifact_versions v
+                        ON v.artifact_id = a.id AND v.version = a.current_version
+                    GROUP BY a.artifact_type, a.status, a.author
                 """).fetchall()
-                stats['by_type'] = {row['artifact_type']: row['count'] for row in type_stats}
 
-                # By status
-                status_stats = conn.execute("""
-                    SELECT status, COUNT(*) as count
-                    FROM artifacts
-                    GROUP BY status
-                """).fetchall()
-                stats['by_status'] = {row['status']: row['count'] for row in status_stats}
-
-                # By author
-                author_stats = conn.execute("""
-                    SELECT author, COUNT(*) as count
-                    FROM artifacts
-                    GROUP BY author
-                    ORDER BY count DESC
-                    LIMIT 10
-                """).fetchall()
-                stats['by_author'] = {row['author']: row['count'] for row in author_stats}
-
-                # Storage size
-                size_stats = conn.execute("""
-                    SELECT SUM(size) as total_size, AVG(size) as avg_size
-                    FROM artifacts
-                """).fetchone()
-                stats['storage'] = {
-                    'total_size': size_stats['total_size'] or 0,
-                    'average_size': size_stats['avg_size'] or 0
+            by_type: Counter[str] = Counter()
+            by_status: Counter[str] = Counter()
+            by_author: Counter[str] = Counter()
+            sized = 0
+            total_size = 0
+            for row in rows:
+                by_type[row['artifact_type']] += row['count']
+                by_status[row['status']] += row['count']
+                by_author[row['author']] += row['count']
+                sized += row['sized']
+                total_size += row['total_size'] or 0
+
+            return {
+                'total_artifacts': by_type.total(),
+                'by_type': dict(by_type),
+                'by_status': dict(by_status),
+                'by_author': dict(by_author.most_common(10)),
+                'storage': {
+                    'total_size': total_size,
+                    'average_size': total_size / sized if sized else 0
                 }
-
-                return stats
+            }
 
         except Exception as e:
             raise ArtifactStorageError(f"Failed to get statistics: {e}")
@@ -600,17 +781,17 @@ class A2AArtifactManager:
             raise ArtifactStorageError(f"Failed to cleanup expired artifacts: {e}")
 
     def _update_cache(self, artifact: A2AArtifact):
-        """Update cache with artifact."""
-        if len(self._cache) >= self._cache_size:
-            # Remove oldest entry
-            oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k].metadata.accessed_at)
-            del self._cache[oldest_key]
-
-        self._cache[artifact.id] = artifact
+        """Update cache with artifact, evicting the least recently used."""
+        with self._conn_lock:
+            self._cache[artifact.id] = artifact
+            self._cache.move_to_end(artifact.id)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
 
     def clear_cache(self):
         """Clear the artifact cache."""
-        self._cache.clear()
+        with self._conn_lock:
+            self._cache.clear()
 
     def export_artifacts(self, artifact_ids: list[str], export_path: str) -> str:
         """Export artifacts to a file."""
@@ -645,25 +826,27 @@ class A2AArtifactManager:
             import_data = json.loads(import_file.read_text(encoding='utf-8'))
             imported_ids = []
 
-            for artifact_data in import_data.get('artifacts', []):
-                try:
-                    artifact = A2AArtifact.from_dict(artifact_data)
+            # Commit the whole import at once rather than once per artifact
+            with self._transaction():
+                for artifact_data in import_data.get('artifacts', []):
+                    try:
+                        artifact = A2AArtifact.from_dict(artifact_data)
 
-                    # Check if artifact already exists
-                    if not overwrite:
-                        try:
-                            existing = self.retrieve_artifact(artifact.id)
-                            if existing:
-                                print(f"Skipping existing artifact {artifact.id}")
-                                continue
-                        except ArtifactNotFoundError:
-                            pass
+                        # Check if artifact already exists
+                        if not overwrite:
+                            try:
+                                existing = self.retrieve_artifact(artifact.id)
+                                if existing:
+                                    print(f"Skipping existing artifact {artifact.id}")
+                                    continue
+                            except ArtifactNotFoundError:
+                                pass
 
-                    self.store_artifact(artifact)
-                    imported_ids.append(artifact.id)
+                        self.store_artifact(artifact)
+                        imported_ids.append(artifact.id)
 
-                except Exception as e:
-                    print(f"Error importing artifact: {e}")
+                    except Exception as e:
+                        print(f"Error importing artifact: {e}")
 
             return imported_ids
 
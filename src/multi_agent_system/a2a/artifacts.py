@@ -235,10 +235,10 @@ class A2AArtifact:
         self.metadata.modified_at = datetime.now(UTC)
         self.create_new_version(author, ["Metadata updated"])
 
-    def access(self, user_id: str):
-        """Record artifact access."""
+    def access(self, user_id: str, accessed_at: datetime | None = None):
+        """Record artifact access, at ``accessed_at`` if given, else now."""
         self.access_count += 1
-        self.metadata.accessed_at = datetime.now(UTC)
+        self.metadata.accessed_at = accessed_at or datetime.now(UTC)
 
     def is_expired(self) -> bool:
         """Check if artifact has expired."""
@@ -144,11 +144,14 @@ class A2AMessageRouter:
     async def _broadcast_message(self, message: A2AMessage) -> None:
         """Broadcast message to all active agents."""
         active_agents = self.get_active_agents()
-        for agent_id in active_agents:
-            try:
-                await self._deliver_to_agent(agent_id, message)
-            except Exception as e:
-                logger.error(f"Error broadcasting to {agent_id}: {e}")
+        # Deliver concurrently so one slow handler does not hold up the rest
+        results = await asyncio.gather(
+            *(self._deliver_to_agent(agent_id, message) for agent_id in active_agents),
+            return_exceptions=True
+        )
+        for agent_id, result in zip(active_agents, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error broadcasting to {agent_id}: {result}")
 
     async def _handle_discovery_message(self, message: A2AMessage) -> bool:
         """Handle discovery messages."""
@@ -1,9 +1,13 @@
 import asyncio
 import logging
 import secrets
+import time
 from abc import ABC, abstractmethod
+from collections import defaultdict, deque
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import islice
 from typing import Any, Dict, List, Optional, Union
 
 from ..a2a import (
@@ -24,6 +28,34 @@ from ..utils.adk_features import (
 from ..session_manager import AnalysisSession
 from ..observability import ObservabilityManager, ErrorSeverity
 
+# Retention caps for the in-memory audit and error history
+MAX_AUDIT_EVENTS = 10_000
+MAX_ERROR_RECORDS = 10_000
+
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") of the last formatted time;
+# rebound as a whole so concurrent readers never see a mixed pair
+_iso_second: tuple[int, str] = (0, "")
+
+
+def _iso_from_ns(timestamp_ns: int) -> str:
+    """Format epoch nanoseconds like ``datetime.isoformat()`` in local time.
+
+    The date/time part is only re-formatted when the second changes; within a
+    second only the microsecond suffix is rendered.
+    """
+    global _iso_second
+    second, frac = divmod(timestamp_ns, 1_000_000_000)
+    cached = _iso_second
+    if second != cached[0]:
+        cached = (second, datetime.fromtimestamp(second).isoformat())
+        _iso_second = cached
+    return f"{cached[1]}.{frac // 1000:06d}"
+
+
+def _iso_now() -> str:
+    """Return the local time in ``datetime.now().isoformat()`` form."""
+    return _iso_from_ns(time.time_ns())
+
 
 @dataclass
 class SecurityContext:
@@ -34,7 +66,7 @@ class SecurityContext:
     session_id: str | None = None
     request_id: str | None = None
 
-@dataclass
+@dataclass(slots=True)
 class ErrorContext:
     """Error context for detailed error reporting."""
     error_type: str
@@ -46,6 +78,33 @@ class ErrorContext:
     stack_trace: str | None = None
     context_data: dict[str, Any] = field(default_factory=dict)
 
+@dataclass(slots=True)
+class AuditEvent:
+    """A single audit log entry.
+
+    The event time is kept as epoch nanoseconds and only formatted when read.
+    """
+    timestamp_ns: int
+    request_id: str
+    user_id: str | None
+    action: str
+    details: dict[str, Any]
+
+    @property
+    def timestamp(self) -> str:
+        """Event time as a local ISO-8601 string."""
+        return _iso_from_ns(self.timestamp_ns)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the event to a dictionary."""
+        return {
+            "timestamp": self.timestamp,
+            "request_id": self.request_id,
+            "user_id": self.user_id,
+            "action": self.action,
+            "details": self.details
+        }
+
 class BaseAgent(ABC):
     """Enhanced base class for all agents with comprehensive ADK features, security, and A2A protocol support."""
 
@@ -433,7 +492,7 @@ class BaseAgent(ABC):
         """Get comprehensive agent metrics."""
         return {
             "name": self.name,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _iso_now(),
             "performance": self.metrics.get_metrics(),
             "resources": self.metrics.get_resource_usage(),
             "circuit_breaker": self.circuit_breaker.get_status(),
@@ -462,7 +521,7 @@ class BaseAgent(ABC):
                 "type": error_type,
                 "message": error_message,
                 "request_id": request_id,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _iso_now()
             },
             "performance": {
                 "request_id": request_id,
@@ -585,13 +644,23 @@ class RateLimiter:
         }
 
 class AuditLogger:
-    """Logs audit events for security and compliance."""
+    """Logs audit events for security and compliance.
 
-    def __init__(self):
-        self.audit_events = []
+    Only the most recent ``max_events`` events are kept in memory; if ``spill``
+    is given it receives each event as it is evicted, e.g. to forward it to a
+    persistent sink.
+    """
+
+    def __init__(
+        self,
+        max_events: int = MAX_AUDIT_EVENTS,
+        spill: Callable[[AuditEvent], None] | None = None
+    ):
+        self.audit_events: deque[AuditEvent] = deque(maxlen=max_events)
+        self.spill = spill
         self.stats = {
             "total_events": 0,
-            "events_by_type": {}
+            "events_by_type": defaultdict(int)
         }
 
     def log_request(
@@ -602,49 +671,67 @@ class AuditLogger:
         details: dict[str, Any]
     ):
         """Log an audit event."""
-        event = {
-            "timestamp": datetime.now().isoformat(),
-            "request_id": request_id,
-            "user_id": user_id,
-            "action": action,
-            "details": details
-        }
-
+        event = AuditEvent(time.time_ns(), request_id, user_id, action, details)
+
+        if (
+            self.spill
+            and self.audit_events
+            and len(self.audit_events) == self.audit_events.maxlen
+        ):
+            self.spill(self.audit_events[0])
         self.audit_events.append(event)
         self.stats["total_events"] += 1
-        self.stats["events_by_type"][action] = self.stats["events_by_type"].get(action, 0) + 1
+        self.stats["events_by_type"][action] += 1
+
+    def get_events(self, offset: int = 0, limit: int | None = None) -> list[AuditEvent]:
+        """Get a window of retained audit events, oldest first."""
+        stop = None if limit is None else offset + limit
+        return list(islice(self.audit_events, offset, stop))
 
     def get_stats(self) -> dict[str, Any]:
         """Get audit statistics."""
-        return self.stats.copy()
+        return {**self.stats, "events_by_type": dict(self.stats["events_by_type"])}
 
 class ErrorHandler:
-    """Handles and tracks errors for monitoring and debugging."""
+    """Handles and tracks errors for monitoring and debugging.
 
-    def __init__(self):
-        self.errors = []
+    Error counters cover every handled error; only the most recent
+    ``max_errors`` contexts are retained, with evicted ones passed to ``spill``.
+    """
+
+    def __init__(
+        self,
+        max_errors: int = MAX_ERROR_RECORDS,
+        spill: Callable[[ErrorContext], None] | None = None
+    ):
+        self.errors: deque[ErrorContext] = deque(maxlen=max_errors)
+        self.spill = spill
         self.error_stats = {
             "total_errors": 0,
-            "errors_by_type": {},
-            "errors_by_code": {}
+            "errors_by_type": defaultdict(int),
+            "errors_by_code": defaultdict(int)
         }
 
     def handle_error(self, error_context: ErrorContext):
         """Handle an error context."""
+        if self.spill and self.errors and len(self.errors) == self.errors.maxlen:
+            self.spill(self.errors[0])
         self.errors.append(error_context)
         self.error_stats["total_errors"] += 1
 
         # Update type statistics
-        self.error_stats["errors_by_type"][error_context.error_type] = \
-            self.error_stats["errors_by_type"].get(error_context.error_type, 0) + 1
+        self.error_stats["errors_by_type"][error_context.error_type] += 1
 
         # Update code statistics
-        self.error_stats["errors_by_code"][error_context.error_code] = \
-            self.error_stats["errors_by_code"].get(error_context.error_code, 0) + 1
+        self.error_stats["errors_by_code"][error_context.error_code] += 1
 
     def get_error_stats(self) -> dict[str, Any]:
         """Get error statistics."""
-        return self.error_stats.copy()
+        return {
+            **self.error_stats,
+            "errors_by_type": dict(self.error_stats["errors_by_type"]),
+            "errors_by_code": dict(self.error_stats["errors_by_code"])
+        }
 
 class RetryPolicy:
     """Implements retry policies for resilient operations."""
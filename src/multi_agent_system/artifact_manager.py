@@ -36,9 +36,8 @@ Features:
        - Agent statistics
 
 Dependencies:
-    - aiofiles: For asynchronous file operations
-    - pathlib: For path manipulation
-    - json: For data serialization
+    - pathlib: For path manipulation and file I/O (run via asyncio.to_thread)
+    - orjson: For data serialization
     - shutil: For directory operations
 
 Example Usage:
@@ -73,14 +72,25 @@ Configuration:
 """
 
 import asyncio
-import json
 import os
 import shutil
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import aiofiles
+import orjson
+
+from .utils.file_io import write_atomic
+
+# Upper bound on artifact files read at once when scanning a directory tree
+MAX_CONCURRENT_READS = 8
+
+# Upper bound on per-file metadata entries kept for listings and stats
+MAX_CACHED_ARTIFACTS = 4096
+
+# The artifact fields list_artifacts and get_artifact_stats need
+_LISTED_FIELDS = ("type", "timestamp")
 
 
 class ArtifactManager:
@@ -139,6 +149,8 @@ class ArtifactManager:
         self.base_dir = Path(base_dir)
         self.base_dir.mkdir(parents=True, exist_ok=True)
         self.lock = asyncio.Lock()
+        # LRU of listing metadata keyed by path, with the file mtime it was read at
+        self._artifact_cache: OrderedDict[str, tuple[int, dict[str, Any]]] = OrderedDict()
 
     async def store_artifact(
         self,
@@ -203,8 +215,13 @@ class ArtifactManager:
             }
 
             # Store artifact
-            async with aiofiles.open(artifact_path, 'w') as f:
-                await f.write(json.dumps(artifact_data, indent=2))
+            await asyncio.to_thread(write_atomic, artifact_path, orjson.dumps(
+                artifact_data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ))
+
+            # Same-second writes reuse the filename, so drop any cached copy
+            self._artifact_cache.pop(str(artifact_path), None)
 
             return str(artifact_path)
 
@@ -229,9 +246,7 @@ class ArtifactManager:
             ```
         """
         async with self.lock:
-            async with aiofiles.open(artifact_path) as f:
-                content = await f.read()
-                return json.loads(content)
+            return orjson.loads(await asyncio.to_thread(Path(artifact_path).read_bytes))
 
     async def list_artifacts(
         self,
@@ -277,10 +292,15 @@ class ArtifactManager:
             if not search_path.exists():
                 return artifacts
 
-            # Walk through directories
+            # store_artifact names files "<type>_<timestamp>.json", so a type
+            # filter can rule files out by name before any of them is read
+            type_prefix = f"{artifact_type}_" if artifact_type else ""
+
+            # Walk through directories, collecting candidate files
+            candidates = []
             for root, _, files in os.walk(search_path):
                 for file in files:
-                    if not file.endswith('.json'):
+                    if not file.endswith('.json') or not file.startswith(type_prefix):
                         continue
 
                     file_path = Path(root) / file
@@ -300,25 +320,27 @@ class ArtifactManager:
                     if agent_id and current_agent_id != agent_id:
                         continue
 
-                    # Read artifact metadata
-                    try:
-                        async with aiofiles.open(file_path) as f:
-                            content = await f.read()
-                            artifact = json.loads(content)
-
-                            if artifact_type and artifact['type'] != artifact_type:
-                                continue
-
-                            artifacts.append({
-                                'path': str(file_path),
-                                'session_id': current_session_id,
-                                'agent_id': current_agent_id,
-                                'type': artifact['type'],
-                                'timestamp': artifact['timestamp']
-                            })
-                    except Exception:
+                    candidates.append((file_path, current_session_id, current_agent_id))
+
+            # Read artifact metadata concurrently
+            contents = await self._read_artifacts([c[0] for c in candidates])
+            for (file_path, current_session_id, current_agent_id), artifact in zip(candidates, contents):
+                if artifact is None:
+                    continue
+                try:
+                    if artifact_type and artifact['type'] != artifact_type:
                         continue
 
+                    artifacts.append({
+                        'path': str(file_path),
+                        'session_id': current_session_id,
+                        'agent_id': current_agent_id,
+                        'type': artifact['type'],
+                        'timestamp': artifact['timestamp']
+                    })
+                except Exception:
+                    continue
+
             return artifacts
 
     async def cleanup_session(self, session_id: str) -> None:
@@ -343,6 +365,10 @@ class ArtifactManager:
             if session_dir.exists():
                 shutil.rmtree(session_dir)
 
+            prefix = str(session_dir) + os.sep
+            for key in [k for k in self._artifact_cache if k.startswith(prefix)]:
+                del self._artifact_cache[key]
+
     async def cleanup_old_artifacts(self, max_age_days: int = 7) -> None:
         """Clean up artifacts older than max_age_days.
 
@@ -371,6 +397,7 @@ class ArtifactManager:
                     file_path = Path(root) / file
                     if file_path.stat().st_mtime < cutoff:
                         file_path.unlink()
+                        self._artifact_cache.pop(str(file_path), None)
 
                 # Remove empty directories
                 if not os.listdir(root):
@@ -409,6 +436,7 @@ class ArtifactManager:
                 'by_type': {}
             }
 
+            typed_files = []
             for root, _, files in os.walk(session_dir):
                 for file in files:
                     if not file.endswith('.json'):
@@ -437,22 +465,74 @@ class ArtifactManager:
                     stats['by_agent'][agent_id]['count'] += 1
                     stats['by_agent'][agent_id]['size'] += size
 
-                    # Read artifact type
-                    try:
-                        async with aiofiles.open(file_path) as f:
-                            content = await f.read()
-                            artifact = json.loads(content)
-                            artifact_type = artifact['type']
-
-                            # Update type stats
-                            if artifact_type not in stats['by_type']:
-                                stats['by_type'][artifact_type] = {
-                                    'count': 0,
-                                    'size': 0
-                                }
-                            stats['by_type'][artifact_type]['count'] += 1
-                            stats['by_type'][artifact_type]['size'] += size
-                    except Exception:
-                        continue
+                    typed_files.append((file_path, size))
+
+            # Read artifact types concurrently
+            contents = await self._read_artifacts([path for path, _ in typed_files])
+            for (_, size), artifact in zip(typed_files, contents):
+                if artifact is None:
+                    continue
+                try:
+                    artifact_type = artifact['type']
+
+                    # Update type stats
+                    if artifact_type not in stats['by_type']:
+                        stats['by_type'][artifact_type] = {
+                            'count': 0,
+                            'size': 0
+                        }
+                    stats['by_type'][artifact_type]['count'] += 1
+                    stats['by_type'][artifact_type]['size'] += size
+                except Exception:
+                    continue
 
             return stats
+
+    async def _read_artifacts(self, paths: list[Path]) -> list[dict[str, Any] | None]:
+        """Read the listing metadata of several artifact files concurrently.
+
+        Args:
+            paths (List[Path]): Artifact files to read
+
+        Returns:
+            List[Optional[Dict[str, Any]]]: Metadata in the order of ``paths``,
+            with None for files that could not be read or parsed
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_READS)
+
+        async def read(path: Path) -> dict[str, Any] | None:
+            async with semaphore:
+                try:
+                    return await self._load_artifact_metadata(path)
+                except Exception:
+                    return None
+
+        return await asyncio.gather(*(read(path) for path in paths))
+
+    async def _load_artifact_metadata(self, artifact_path: str | Path) -> dict[str, Any]:
+        """Return an artifact's type and timestamp, re-reading the file only if it has changed.
+
+        Only the listed fields are cached, not the artifact data, and the
+        cache is capped at MAX_CACHED_ARTIFACTS entries (least recently used
+        evicted first).
+
+        Args:
+            artifact_path (Union[str, Path]): Path to artifact
+
+        Returns:
+            Dict[str, Any]: The artifact's ``type`` and ``timestamp`` fields
+        """
+        key = str(artifact_path)
+        mtime = os.stat(artifact_path).st_mtime_ns
+        cached = self._artifact_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            self._artifact_cache.move_to_end(key)
+            return cached[1]
+
+        artifact = orjson.loads(await asyncio.to_thread(Path(artifact_path).read_bytes))
+        metadata = {field: artifact[field] for field in _LISTED_FIELDS if field in artifact}
+        self._artifact_cache[key] = (mtime, metadata)
+        self._artifact_cache.move_to_end(key)
+        while len(self._artifact_cache) > MAX_CACHED_ARTIFACTS:
+            self._artifact_cache.popitem(last=False)
+        return metadata
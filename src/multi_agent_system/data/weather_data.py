@@ -77,14 +77,17 @@ Error Handling Strategy:
     - Critical errors should be reported to the user with clear next steps
 """
 
+import asyncio
 import hashlib
 import json
 import logging
 import os
+import threading
 from datetime import datetime, timedelta
 from functools import lru_cache
 from pathlib import Path
 
+import orjson
 import pandas as pd
 import requests
 
@@ -116,6 +119,34 @@ class NOAAWeatherData:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
         self.cache_expiry = timedelta(hours=1)  # Cache expires after 1 hour
+        # One requests.Session per worker thread: sessions are not thread-safe,
+        # but each still reuses its TCP/TLS connections across requests. All
+        # of them are tracked so close() can release their connection pools.
+        self._local = threading.local()
+        self._sessions: list[requests.Session] = []
+        self._sessions_lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """The calling thread's HTTP session, created on first use."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+
+    def close(self) -> None:
+        """Close every thread's HTTP session; later requests open new ones."""
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+            self._local = threading.local()
+        for session in sessions:
+            session.close()
+
+    def _http_get(self, url: str, **kwargs) -> requests.Response:
+        """GET ``url`` with the session of the thread this runs on."""
+        return self.session.get(url, **kwargs)
 
     def _get_cache_key(self, params: dict) -> str:
         """Generate a unique cache key for the request parameters."""
@@ -255,16 +286,20 @@ class NOAAWeatherData:
         # Fetch fresh data from API
         try:
             logger.info("Fetching fresh data from NOAA API")
-            response = requests.get(
+            # requests is blocking; run it in a worker thread so concurrent
+            # fetches on the event loop can overlap
+            response = await asyncio.to_thread(
+                self._http_get,
                 f"{self.base_url}/api/v1/data",
                 params=params,
-                headers={"token": self.api_key} if self.api_key else {}
+                headers={"token": self.api_key} if self.api_key else {},
+                timeout=30
             )
             response.raise_for_status()
 
             # Process response based on format
             if format == "json":
-                data = response.json()
+                data = orjson.loads(response.content)
             elif format == "csv":
                 data = pd.read_csv(response.content)
             else:
@@ -278,7 +313,7 @@ class NOAAWeatherData:
                 "result": data
             }
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             logger.error(f"API request failed: {e}")
             return {
                 "status": "error",
@@ -464,6 +499,7 @@ async def get_weather_data(
             )
         ```
     """
+    noaa = None
     try:
         noaa = NOAAWeatherData()
         data = await noaa.get_severe_weather_data(
@@ -479,3 +515,6 @@ async def get_weather_data(
             "status": "error",
             "error": str(e)
         }
+    finally:
+        if noaa is not None:
+            noaa.close()
@@ -47,7 +47,7 @@ Features:
        - Performance insights
 
 Dependencies:
-    - aiofiles: For asynchronous file operations
+    - pathlib: For checkpoint file I/O (run via asyncio.to_thread)
     - logging: For system logging
     - datetime: For timestamp management
     - json: For data serialization
@@ -88,13 +88,12 @@ Configuration:
 import asyncio
 import json
 import logging
+from collections import deque
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import aiofiles
-
 # Import canonical enums from src/enums.py
 from enums import InteractionType, DecisionPattern, ErrorSeverity
 
@@ -102,6 +101,9 @@ from enums import InteractionType, DecisionPattern, ErrorSeverity
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Most recent interactions/decisions/errors kept per agent for pattern analysis
+MAX_PATTERN_HISTORY = 10_000
+
 
 @dataclass
 class Checkpoint:
@@ -294,26 +296,26 @@ class AgentPatterns:
 
     Attributes:
         agent_id (str): ID of the agent
-        interaction_history (List[InteractionMetrics]): History of interactions
-        decision_history (List[DecisionMetrics]): History of decisions
-        error_history (List[ErrorContext]): History of errors
+        interaction_history (Deque[InteractionMetrics]): Recent interactions
+        decision_history (Deque[DecisionMetrics]): Recent decisions
+        error_history (Deque[ErrorContext]): Recent errors
         checkpoints (List[Checkpoint]): History of checkpoints
 
     Example:
         ```python
         patterns = AgentPatterns(
             agent_id="risk_analyzer",
-            interaction_history=[],
-            decision_history=[],
-            error_history=[],
+            interaction_history=deque(maxlen=MAX_PATTERN_HISTORY),
+            decision_history=deque(maxlen=MAX_PATTERN_HISTORY),
+            error_history=deque(maxlen=MAX_PATTERN_HISTORY),
             checkpoints=[]
         )
         ```
     """
     agent_id: str
-    interaction_history: list[InteractionMetrics]
-    decision_history: list[DecisionMetrics]
-    error_history: list[ErrorContext]
+    interaction_history: deque[InteractionMetrics]
+    decision_history: deque[DecisionMetrics]
+    error_history: deque[ErrorContext]
     checkpoints: list[Checkpoint]
 
 class PatternMonitor:
@@ -378,7 +380,7 @@ class PatternMonitor:
 
         Pattern Initialization:
             1. Creates AgentPatterns if not exists
-            2. Initializes empty history lists
+            2. Initializes empty bounded histories
             3. Sets up pattern tracking
 
         Example:
@@ -389,9 +391,9 @@ class PatternMonitor:
         if agent_id not in self.agent_patterns:
             self.agent_patterns[agent_id] = AgentPatterns(
                 agent_id=agent_id,
-                interaction_history=[],
-                decision_history=[],
-                error_history=[],
+                interaction_history=deque(maxlen=MAX_PATTERN_HISTORY),
+                decision_history=deque(maxlen=MAX_PATTERN_HISTORY),
+                error_history=deque(maxlen=MAX_PATTERN_HISTORY),
                 checkpoints=[]
             )
 
@@ -399,17 +401,15 @@ class PatternMonitor:
         """Save checkpoint to disk asynchronously."""
         async with self._checkpoint_lock:
             checkpoint_path = self.checkpoint_dir / f"{checkpoint.id}.json"
-            async with aiofiles.open(checkpoint_path, 'w') as f:
-                await f.write(json.dumps(checkpoint.to_dict()))
+            await asyncio.to_thread(checkpoint_path.write_text, json.dumps(checkpoint.to_dict()))
 
     async def _load_checkpoint(self, checkpoint_id: str) -> Checkpoint | None:
         """Load checkpoint from disk asynchronously."""
         checkpoint_path = self.checkpoint_dir / f"{checkpoint_id}.json"
         if not checkpoint_path.exists():
             return None
-        async with aiofiles.open(checkpoint_path) as f:
-            data = json.loads(await f.read())
-            return Checkpoint.from_dict(data)
+        data = json.loads(await asyncio.to_thread(checkpoint_path.read_bytes))
+        return Checkpoint.from_dict(data)
 
     async def create_checkpoint(
         self,
@@ -447,12 +447,13 @@ class PatternMonitor:
     async def list_checkpoints(self, agent_id: str | None = None) -> list[dict[str, Any]]:
         """List available checkpoints, optionally filtered by agent_id."""
         checkpoints = []
-        for checkpoint_file in self.checkpoint_dir.glob("*.json"):
+        for checkpoint_file in self.checkpoint_dir.iterdir():
+            if checkpoint_file.suffix != ".json":
+                continue
             try:
-                async with aiofiles.open(checkpoint_file) as f:
-                    data = json.loads(await f.read())
-                    if agent_id is None or data['agent_id'] == agent_id:
-                        checkpoints.append(data)
+                data = json.loads(await asyncio.to_thread(checkpoint_file.read_bytes))
+                if agent_id is None or data['agent_id'] == agent_id:
+                    checkpoints.append(data)
             except Exception as e:
                 print(f"Error loading checkpoint {checkpoint_file}: {e}")
         return sorted(checkpoints, key=lambda x: x['timestamp'], reverse=True)
@@ -469,7 +470,9 @@ class PatternMonitor:
         """Clean up checkpoints older than max_age_days."""
         cutoff = datetime.now().timestamp() - (max_age_days * 24 * 60 * 60)
         deleted = 0
-        for checkpoint_file in self.checkpoint_dir.glob("*.json"):
+        for checkpoint_file in self.checkpoint_dir.iterdir():
+            if checkpoint_file.suffix != ".json":
+                continue
             try:
                 if checkpoint_file.stat().st_mtime < cutoff:
                     checkpoint_file.unlink()
@@ -6,7 +6,6 @@ for the multi-agent climate risk analysis system.
 """
 
 import asyncio
-import json
 import logging
 import os
 import secrets
@@ -16,8 +15,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
-import aiofiles
 import jwt
+import orjson
 from dotenv import load_dotenv
 from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
@@ -29,6 +28,7 @@ from .utils.adk_features import (
     Monitoring,
     WorkerPool,
 )
+from .utils.file_io import write_atomic
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -45,6 +45,8 @@ MAX_CONCURRENT_OPERATIONS = int(os.getenv("MAX_CONCURRENT_OPERATIONS", "5"))
 MAX_RETRY_ATTEMPTS = int(os.getenv("MAX_RETRY_ATTEMPTS", "3"))
 RETRY_DELAY = int(os.getenv("RETRY_DELAY", "1"))
 SESSION_TIMEOUT = int(os.getenv("SESSION_TIMEOUT", "3600"))  # 1 hour
+PERSIST_DEBOUNCE_SECONDS = float(os.getenv("PERSIST_DEBOUNCE_SECONDS", "0.5"))
+MAX_CONCURRENT_SESSION_LOADS = 16
 
 # JWT_SECRET security handling
 # SECURITY: JWT_SECRET must be set explicitly in production
@@ -294,6 +296,12 @@ class SessionManager:
         self.semaphore = asyncio.Semaphore(max_concurrent)
         self._cleanup_task = None
 
+        # Sessions with unsaved coalesced updates (update_session(coalesce=True)),
+        # written out together shortly after the first such update
+        self._dirty_sessions: set[str] = set()
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_task: asyncio.Task | None = None
+
         # Initialize ADK features
         self.metrics_collector = MetricsCollector()
         self.circuit_breaker = CircuitBreaker(
@@ -316,6 +324,8 @@ class SessionManager:
         """Stop the session manager and persist sessions."""
         if self._cleanup_task:
             self._cleanup_task.cancel()
+        await self._drain_scheduled_flush()
+        self._dirty_sessions.clear()
         await self._persist_all_sessions()
 
     async def create_session(
@@ -367,15 +377,25 @@ class SessionManager:
         session_id: str,
         agent_name: str,
         result: dict,
-        retry: bool = True
+        retry: bool = True,
+        coalesce: bool = False
     ) -> None:
         """Update a session with agent results.
 
+        The session is written to disk before this returns. Callers issuing
+        bursts of updates can pass ``coalesce=True`` instead: the session is
+        then only marked dirty and written PERSIST_DEBOUNCE_SECONDS later
+        together with any other updates made in that window. Such an update
+        is not durable until the background write, ``flush()`` or ``stop()``
+        completes, and a failed background write is only logged (the session
+        stays dirty and is retried by the next flush).
+
         Args:
             session_id: Session identifier
             agent_name: Name of the agent
             result: Result from agent operation
             retry: Whether to retry on failure
+            coalesce: Defer the write and batch it with other recent updates
 
         Raises:
             SecurityError: If security requirements are not met
@@ -385,26 +405,97 @@ class SessionManager:
             raise ValueError(f"Session {session_id} not found")
 
         session.update_agent_state(agent_name, result)
-        await self._persist_session(session)
+        if coalesce:
+            self._schedule_persist(session_id)
+        else:
+            self._dirty_sessions.discard(session_id)
+            await self._persist_session(session)
+
+    async def flush(self) -> None:
+        """Write all pending session updates to disk now.
+
+        Unlike the background flush, write errors are raised; sessions that
+        could not be written stay marked dirty.
+        """
+        await self._drain_scheduled_flush()
+        dirty, self._dirty_sessions = self._dirty_sessions, set()
+        pending = list(dirty)
+        for index, session_id in enumerate(pending):
+            session = self.sessions.get(session_id)
+            if session is None:
+                continue
+            try:
+                await self._persist_session(session)
+            except Exception:
+                self._dirty_sessions.update(pending[index:])
+                raise
+
+    def _schedule_persist(self, session_id: str) -> None:
+        """Mark a session as changed and schedule a coalesced write."""
+        self._dirty_sessions.add(session_id)
+        if self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(PERSIST_DEBOUNCE_SECONDS, self._start_flush)
+
+    def _start_flush(self) -> None:
+        """Start writing out the sessions marked as changed.
+
+        Each flush waits for the one before it, so two flushes never write
+        the same session at once and awaiting ``_flush_task`` covers all.
+        """
+        self._flush_handle = None
+        self._flush_task = asyncio.create_task(self._flush_dirty_sessions(self._flush_task))
+
+    async def _drain_scheduled_flush(self) -> None:
+        """Cancel any pending timer and wait for in-flight flushes."""
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._flush_task:
+            await self._flush_task
+            self._flush_task = None
+
+    async def _flush_dirty_sessions(self, previous: asyncio.Task | None = None) -> None:
+        """Persist every session marked as changed since the last flush."""
+        if previous is not None:
+            await previous
+        dirty, self._dirty_sessions = self._dirty_sessions, set()
+        for session_id in dirty:
+            session = self.sessions.get(session_id)
+            if session is None:
+                continue
+            try:
+                await self._persist_session(session)
+            except Exception as e:
+                # Keep it dirty so the next flush (or stop) retries the write
+                self._dirty_sessions.add(session_id)
+                logger.error(f"Error persisting session {session_id}: {str(e)}")
 
     async def _persist_session(self, session: AnalysisSession) -> None:
         """Persist a session to storage."""
         session.last_persisted = datetime.now()
         file_path = self.storage_dir / f"{session.session_id}.json"
 
-        async with aiofiles.open(file_path, 'w') as f:
-            await f.write(json.dumps(session.to_dict()))
+        payload = orjson.dumps(session.to_dict(), option=orjson.OPT_NON_STR_KEYS)
+        await asyncio.to_thread(write_atomic, file_path, payload)
 
     async def _load_persisted_sessions(self) -> None:
-        """Load persisted sessions from storage."""
-        for file_path in self.storage_dir.glob("*.json"):
-            try:
-                async with aiofiles.open(file_path) as f:
-                    data = json.loads(await f.read())
-                    session = AnalysisSession.from_dict(data)
-                    self.sessions[session.session_id] = session
-            except Exception as e:
-                logger.error(f"Error loading session {file_path}: {str(e)}")
+        """Load persisted sessions from storage, reading the files concurrently."""
+        paths = [p for p in self.storage_dir.iterdir() if p.suffix == ".json"]
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SESSION_LOADS)
+
+        async def load(file_path: Path) -> AnalysisSession | None:
+            async with semaphore:
+                try:
+                    data = orjson.loads(await asyncio.to_thread(file_path.read_bytes))
+                    return AnalysisSession.from_dict(data)
+                except Exception as e:
+                    logger.error(f"Error loading session {file_path}: {str(e)}")
+                    return None
+
+        for session in await asyncio.gather(*(load(p) for p in paths)):
+            if session is not None:
+                self.sessions[session.session_id] = session
 
     async def _persist_all_sessions(self) -> None:
         """Persist all active sessions."""
@@ -1,10 +1,21 @@
 import asyncio
 import logging
+import time
 from contextlib import contextmanager
 from datetime import datetime
 from typing import Any
 
 
+def _fast_iso(ns: int) -> str:
+    """Format a ``time.time_ns()`` value as an ISO-8601 UTC timestamp."""
+    s, ns_rem = divmod(ns, 1_000_000_000)
+    tm = time.gmtime(s)
+    return (
+        f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+        f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}.{ns_rem // 1000:06d}Z"
+    )
+
+
 class MetricsCollector:
     """Collects performance metrics and resource usage."""
 
@@ -23,7 +34,7 @@ class MetricsCollector:
             duration = (datetime.now() - start_time).total_seconds()
             self.metrics[operation] = {
                 "duration": duration,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _fast_iso(time.time_ns())
             }
 
     @contextmanager
@@ -146,7 +157,7 @@ class Monitoring:
     def track_operation(self, operation: str, metadata: dict[str, Any] = None):
         """Track operation with metadata."""
         self.metrics.metrics[operation] = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _fast_iso(time.time_ns()),
             "metadata": metadata or {}
         }
 
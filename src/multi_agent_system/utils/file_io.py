@@ -0,0 +1,23 @@
+"""
+File helpers shared by the on-disk session and artifact stores.
+"""
+
+import os
+import secrets
+from pathlib import Path
+
+
+def write_atomic(path: Path, payload: bytes) -> None:
+    """Write ``payload`` to a temp file beside ``path`` and rename it into place.
+
+    Readers never observe a half-written file, and an interrupted write
+    leaves the previous version intact. The temp name ends in ``.tmp``, so
+    scans that filter on ``.json`` never pick it up.
+    """
+    tmp_path = path.with_name(f"{path.name}.{secrets.token_hex(4)}.tmp")
+    try:
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
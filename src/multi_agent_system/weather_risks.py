@@ -2,18 +2,259 @@
 Weather risk analysis module that uses both OpenWeather API and NOAA data sources.
 """
 
+import asyncio
+import importlib.util
 import logging
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any
 
-import requests
+import aiohttp
+import numpy as np
+import orjson
+from cachetools import TTLCache
 
 from .data.weather_data import NOAAWeatherData, get_weather_data
-from .risk_definitions import get_consensus_thresholds
+from .risk_definitions import RiskSource, get_consensus_thresholds
+
+# numba is optional and takes a noticeable fraction of a second to import, so
+# it is only loaded the first time historical events are counted
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# In-process cache settings: current conditions go stale quickly, while the
+# five-year NOAA history barely changes within an hour. Entries are kept up to
+# STALE_CACHE_TTL so they can be served when the upstream fetch fails.
+CURRENT_CACHE_TTL = 120
+HISTORICAL_CACHE_TTL = 3600
+STALE_CACHE_TTL = 24 * 3600
+CACHE_MAX_SIZE = 1024
+
+# Locations fetched at once by analyze_risks_batch
+DEFAULT_BATCH_CONCURRENCY = 16
+
+# Historical frequency criteria over the five-year NOAA window
+FLOOD_SEVERITY_THRESHOLD = 0.8  # 80% of a 100-year flood
+HEAT_SEVERITY_THRESHOLD = 0.9  # 90th percentile heat
+FREQUENT_FLOOD_COUNT = 2
+FREQUENT_HEAT_COUNT = 3
+
+# Small integer codes for historical event types, assigned at ingest
+EVENT_OTHER = 0
+EVENT_FLOOD = 1
+EVENT_HEAT = 2
+EVENT_TYPE_CODES = {"flood": EVENT_FLOOD, "heat": EVENT_HEAT}
+
+# Risk levels used by the vectorized scoring in analyze_risks_batch
+LEVEL_NONE = 0
+LEVEL_MEDIUM = 1
+LEVEL_HIGH = 2
+LEVEL_SUPER_EXTREME = 3
+
+# Recommendations attached to each risk level; shared, so kept immutable
+HEAT_SUPER_EXTREME_RECOMMENDATIONS = (
+    "Immediate action required: Stay indoors, use air conditioning, and check on vulnerable individuals",
+    "Contact local emergency services if necessary",
+    "Review and update heat preparedness plans",
+    "Consider long-term heat mitigation strategies",
+)
+HEAT_HIGH_RECOMMENDATIONS = (
+    "Stay hydrated and avoid outdoor activities during peak hours",
+    "Check on vulnerable individuals",
+    "Use air conditioning or cooling centers if available",
+    "Monitor local heat advisories",
+)
+HEAT_MEDIUM_RECOMMENDATIONS = (
+    "Stay hydrated",
+    "Limit outdoor activities during peak hours",
+    "Monitor local weather updates",
+)
+FLOOD_SUPER_EXTREME_RECOMMENDATIONS = (
+    "Immediate evacuation may be necessary",
+    "Contact local emergency services",
+    "Review and update flood preparedness plans",
+    "Consider long-term flood mitigation strategies",
+)
+FLOOD_HIGH_RECOMMENDATIONS = (
+    "Move to higher ground if in a flood-prone area",
+    "Avoid driving through flooded areas",
+    "Stay informed about local flood warnings",
+    "Follow evacuation orders if issued",
+)
+FLOOD_MEDIUM_RECOMMENDATIONS = (
+    "Be cautious in low-lying areas",
+    "Monitor local weather updates",
+    "Prepare for potential flooding",
+)
+WILDFIRE_HIGH_RECOMMENDATIONS = (
+    "Avoid outdoor burning",
+    "Be prepared for potential evacuation",
+    "Monitor local fire warnings",
+    "Have an evacuation plan ready",
+)
+WILDFIRE_MEDIUM_RECOMMENDATIONS = (
+    "Be cautious with outdoor activities",
+    "Monitor local fire conditions",
+    "Prepare for potential fire outbreaks",
+)
+STORM_HIGH_RECOMMENDATIONS = (
+    "Seek shelter immediately",
+    "Stay away from windows and electrical equipment",
+    "Monitor local storm warnings",
+    "Follow emergency instructions",
+)
+STORM_MEDIUM_RECOMMENDATIONS = (
+    "Stay indoors if possible",
+    "Monitor local weather updates",
+    "Be prepared for power outages",
+)
+
+# Description templates for risks that report the observed readings
+HEAT_HIGH_DESCRIPTION = "Extreme heat conditions detected ({}°C)"
+HEAT_MEDIUM_DESCRIPTION = "High temperature conditions detected ({}°C)"
+FLOOD_HIGH_DESCRIPTION = "Extreme rainfall detected ({}mm in the last hour)"
+FLOOD_MEDIUM_DESCRIPTION = "Heavy rainfall detected ({}mm in the last hour)"
+WILDFIRE_HIGH_DESCRIPTION = (
+    "High wildfire risk conditions: High temperature ({}°C), low humidity ({}%), "
+    "and strong winds ({} m/s)"
+)
+WILDFIRE_MEDIUM_DESCRIPTION = (
+    "Moderate wildfire risk conditions: Elevated temperature ({}°C), low humidity ({}%), "
+    "and moderate winds ({} m/s)"
+)
+
+# OpenWeather ``weather[].main`` values (lowercased) that indicate storm risk
+STORM_CONDITIONS = {
+    "thunderstorm": ("High", "Thunderstorm conditions detected"),
+    "tornado": ("High", "Tornado conditions detected"),
+    "tropical storm": ("High", "Tropical storm conditions detected"),
+    "hurricane": ("High", "Hurricane conditions detected"),
+    "squall": ("Medium", "Squall conditions detected"),
+    "storm": ("Medium", "Storm conditions detected"),
+}
+
+# OpenWeather condition IDs outside the 2xx thunderstorm group that indicate
+# storm risk (7xx atmosphere codes such as mist and haze are not storms)
+STORM_CONDITION_IDS = {
+    771: STORM_CONDITIONS["squall"],
+    781: STORM_CONDITIONS["tornado"],
+    900: STORM_CONDITIONS["tornado"],
+    901: STORM_CONDITIONS["tropical storm"],
+    902: STORM_CONDITIONS["hurricane"],
+}
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _describe(template: str, *readings: float) -> str:
+    """Format a risk description, reusing it for repeated readings across a batch.
+
+    ``typed=True`` keeps e.g. ``35`` and ``35.0`` apart so the text matches the
+    reading exactly as reported.
+    """
+    return template.format(*readings)
+
+
+def _as_reading(value: Any) -> float:
+    """Return a weather reading as a float, or NaN if it is missing or not numeric."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _classify_storm(condition: dict) -> tuple[str, str] | None:
+    """Return (severity, description) for a storm condition, or None.
+
+    Uses the numeric OpenWeather condition ID when present and falls back to
+    the ``main`` label otherwise.
+    """
+    weather_id = condition.get("id")
+    if isinstance(weather_id, int):
+        if 200 <= weather_id <= 232:
+            return STORM_CONDITIONS["thunderstorm"]
+        return STORM_CONDITION_IDS.get(weather_id)
+    return STORM_CONDITIONS.get(condition.get("main", "").lower())
+
+
+@dataclass(slots=True, frozen=True)
+class Risk:
+    """A single identified climate risk for one location.
+
+    ``sources`` is stored as a tuple but left out of the hash, since
+    ``RiskSource`` records are mutable and unhashable.
+    """
+    type: str
+    severity: str
+    description: str
+    sources: tuple[RiskSource, ...] = field(hash=False)
+    recommendations: tuple[str, ...]
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.sources, tuple):
+            object.__setattr__(self, "sources", tuple(self.sources))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the risk to the dictionary shape returned by ``analyze_risks``."""
+        return {
+            "type": self.type,
+            "severity": self.severity,
+            "description": self.description,
+            "sources": list(self.sources),
+            "recommendations": list(self.recommendations)
+        }
+
+
+def _count_with_numpy(types: np.ndarray, severity: np.ndarray) -> tuple[int, int]:
+    """Return (significant floods, extreme heat events) from coded event arrays."""
+    floods = int(((types == EVENT_FLOOD) & (severity >= FLOOD_SEVERITY_THRESHOLD)).sum())
+    heat = int(((types == EVENT_HEAT) & (severity >= HEAT_SEVERITY_THRESHOLD)).sum())
+    return floods, heat
+
+
+def _count_with_loop(types: np.ndarray, severity: np.ndarray) -> tuple[int, int]:
+    # Single fused pass: no intermediate boolean arrays for long histories.
+    # Only used once compiled by Numba.
+    floods = 0
+    heat = 0
+    for i in range(types.shape[0]):
+        if types[i] == EVENT_FLOOD and severity[i] >= FLOOD_SEVERITY_THRESHOLD:
+            floods += 1
+        elif types[i] == EVENT_HEAT and severity[i] >= HEAT_SEVERITY_THRESHOLD:
+            heat += 1
+    return floods, heat
+
+
+_event_counter: Callable[[np.ndarray, np.ndarray], tuple[int, int]] | None = None
+
+
+def _load_event_counter() -> Callable[[np.ndarray, np.ndarray], tuple[int, int]]:
+    """Pick the event counting kernel, compiling and warming it if Numba is present.
+
+    Compilation can take seconds on a cold cache, so ``analyze_risks_batch``
+    runs this in a worker thread rather than on the event loop.
+    """
+    global _event_counter
+    if _event_counter is None:
+        if NUMBA_AVAILABLE:
+            from numba import njit
+            counter = njit(cache=True)(_count_with_loop)
+            counter(np.zeros(1, dtype=np.int8), np.zeros(1, dtype=np.float64))
+        else:
+            counter = _count_with_numpy
+        _event_counter = counter
+    return _event_counter
+
+
+def _count_significant_events(types: np.ndarray, severity: np.ndarray) -> tuple[int, int]:
+    """Count significant events with the kernel chosen by ``_load_event_counter``."""
+    counter = _event_counter if _event_counter is not None else _load_event_counter()
+    return counter(types, severity)
+
+
 class ClimateRiskAnalyzer:
     """A comprehensive climate risk analysis tool that uses both OpenWeather API and NOAA data.
 
@@ -28,6 +269,9 @@ class ClimateRiskAnalyzer:
         openweather_api_key (str): OpenWeatherMap API key
         noaa_data (NOAAWeatherData): NOAA weather data handler
         thresholds (Dict): Risk thresholds from authoritative sources
+
+    The OpenWeather client keeps one aiohttp session for its lifetime; call
+    ``close()`` when the analyzer is no longer needed.
     """
 
     def __init__(self, openweather_api_key: str, noaa_api_key: str | None = None):
@@ -43,7 +287,100 @@ class ClimateRiskAnalyzer:
         self.openweather_api_key = openweather_api_key
         self.noaa_data = NOAAWeatherData(api_key=noaa_api_key)
         self.thresholds = get_consensus_thresholds()
+        self._flatten_thresholds()
         self.base_url = "http://api.openweathermap.org/data/2.5"
+        self._session: aiohttp.ClientSession | None = None
+        # Entries are (data, fresh_until); the TTLCache itself enforces the hard expiry
+        self._current_cache = TTLCache(maxsize=CACHE_MAX_SIZE, ttl=STALE_CACHE_TTL)
+        self._historical_cache = TTLCache(maxsize=CACHE_MAX_SIZE, ttl=STALE_CACHE_TTL)
+        self._inflight: dict[tuple, asyncio.Task] = {}
+
+    def _flatten_thresholds(self) -> None:
+        """Copy the nested threshold values used by ``analyze_risks`` into attributes."""
+        heat = self.thresholds["extreme_heat"]
+        self._heat_high_temp = heat["high"]["temperature"]
+        self._heat_medium_temp = heat["medium"]["temperature"]
+        self._heat_high_sources = tuple(heat["high"]["sources"])
+        self._heat_medium_sources = tuple(heat["medium"]["sources"])
+
+        flood = self.thresholds["flooding"]
+        self._flood_high_rain = flood["high"]["rainfall_1h"]
+        self._flood_medium_rain = flood["medium"]["rainfall_1h"]
+        self._flood_high_sources = tuple(flood["high"]["sources"])
+        self._flood_medium_sources = tuple(flood["medium"]["sources"])
+
+        wildfire = self.thresholds["wildfire"]
+        self._wildfire_high = (
+            wildfire["high"]["temperature"],
+            wildfire["high"]["humidity"],
+            wildfire["high"]["wind_speed"],
+        )
+        self._wildfire_medium = (
+            wildfire["medium"]["temperature"],
+            wildfire["medium"]["humidity"],
+            wildfire["medium"]["wind_speed"],
+        )
+        self._wildfire_high_sources = tuple(wildfire["high"]["sources"])
+        self._wildfire_medium_sources = tuple(wildfire["medium"]["sources"])
+
+        storms = self.thresholds["extreme_storms"]
+        self._storm_high_sources = tuple(storms["high"]["sources"])
+        self._storm_medium_sources = tuple(storms["medium"]["sources"])
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared HTTP session and the NOAA client's sessions."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self.noaa_data.close()
+
+    async def _cached_fetch(
+        self, cache: TTLCache, key: tuple, ttl: float, fetch: Callable[[], Awaitable[dict]]
+    ) -> dict:
+        """Return the cached value for ``key`` if fresh, else run ``fetch()`` once.
+
+        Concurrent callers asking for the same key while a fetch is running
+        share the in-flight task instead of issuing duplicate upstream requests.
+        The lookup and task registration contain no ``await``, so they cannot
+        interleave with other coroutines on the event loop.
+        """
+        entry = cache.get(key)
+        if entry is not None and time.monotonic() < entry[1]:
+            logger.debug(f"cache=HIT {key}")
+            return entry[0]
+
+        task = self._inflight.get(key)
+        if task is None:
+            logger.debug(f"cache=MISS {key}")
+            task = asyncio.create_task(self._fill_cache(cache, key, ttl, fetch))
+            self._inflight[key] = task
+        return await asyncio.shield(task)
+
+    async def _fill_cache(
+        self, cache: TTLCache, key: tuple, ttl: float, fetch: Callable[[], Awaitable[dict]]
+    ) -> dict:
+        """Run ``fetch()`` and cache its result, falling back to a stale entry on error."""
+        try:
+            result = await fetch()
+        except Exception as e:
+            entry = cache.get(key)
+            if entry is None:
+                raise
+            logger.warning(f"cache=STALE {key}: serving cached data after fetch error: {str(e)}")
+            return entry[0]
+        else:
+            cache[key] = (result, time.monotonic() + ttl)
+            return result
+        finally:
+            self._inflight.pop(key, None)
 
     async def get_weather_data(self, lat: float, lon: float) -> dict:
         """Fetch current weather data from both sources.
@@ -63,48 +400,57 @@ class ClimateRiskAnalyzer:
         if not -180 <= lon <= 180:
             raise ValueError("Longitude must be between -180 and 180")
 
-        # Get current date and previous day for data range
+        key = ("current", round(lat, 3), round(lon, 3))
+        return await self._cached_fetch(
+            self._current_cache, key, CURRENT_CACHE_TTL, lambda: self._fetch_weather_data(lat, lon)
+        )
+
+    async def _fetch_weather_data(self, lat: float, lon: float) -> dict:
+        """Fetch current weather data from all sources, bypassing the cache."""
+        # Get current date and previous day for data range, formatted once
         end_date = datetime.now()
-        start_date = end_date - timedelta(days=1)
+        end_day = end_date.strftime("%Y-%m-%d")
+        start_day = (end_date - timedelta(days=1)).strftime("%Y-%m-%d")
+        location = f"{lat},{lon}"
 
         try:
-            # 1. Get OpenWeather current data
-            openweather_data = await self._get_openweather_data(lat, lon)
-
-            # 2. Get NOAA severe weather data
-            noaa_data = await self.noaa_data.get_severe_weather_data(
-                start_date=start_date.strftime("%Y-%m-%d"),
-                end_date=end_date.strftime("%Y-%m-%d"),
-                location=f"{lat},{lon}",
-                data_type="all",
-                format="json"
-            )
-
-            if noaa_data["status"] == "error":
-                logger.warning(f"Failed to fetch NOAA data: {noaa_data.get('error')}")
-                noaa_data = {"result": {}}
-
-            # 3. Get basic weather data as additional source
-            basic_data = await get_weather_data(
-                location=f"{lat},{lon}",
-                time_period=end_date.strftime("%Y-%m"),
-                force_refresh=False
-            )
-
-            if basic_data["status"] == "error":
-                logger.warning(f"Failed to fetch basic weather data: {basic_data.get('error')}")
-                basic_data = {"result": {}}
-
-            # Combine all data sources
-            return {
-                "current_weather": openweather_data,
-                "severe_weather": noaa_data["result"],
-                "basic_weather": basic_data["result"]
-            }
-
-        except Exception as e:
-            logger.error(f"Error fetching weather data: {str(e)}")
-            raise
+            # Fetch OpenWeather, NOAA and basic weather data concurrently
+            async with asyncio.TaskGroup() as tg:
+                openweather_task = tg.create_task(self._get_openweather_data(lat, lon))
+                noaa_task = tg.create_task(self.noaa_data.get_severe_weather_data(
+                    start_date=start_day,
+                    end_date=end_day,
+                    location=location,
+                    data_type="all",
+                    format="json"
+                ))
+                basic_task = tg.create_task(get_weather_data(
+                    location=location,
+                    time_period=end_day[:7],  # YYYY-MM
+                    force_refresh=False
+                ))
+        except ExceptionGroup as eg:
+            logger.error(f"Error fetching weather data: {str(eg.exceptions[0])}")
+            raise eg.exceptions[0] from None
+
+        openweather_data = openweather_task.result()
+
+        noaa_data = noaa_task.result()
+        if noaa_data["status"] == "error":
+            logger.warning(f"Failed to fetch NOAA data: {noaa_data.get('error')}")
+            noaa_data = {"result": {}}
+
+        basic_data = basic_task.result()
+        if basic_data["status"] == "error":
+            logger.warning(f"Failed to fetch basic weather data: {basic_data.get('error')}")
+            basic_data = {"result": {}}
+
+        # Combine all data sources
+        return {
+            "current_weather": openweather_data,
+            "severe_weather": noaa_data["result"],
+            "basic_weather": basic_data["result"]
+        }
 
     async def _get_openweather_data(self, lat: float, lon: float) -> dict:
         """Fetch current weather data from OpenWeather API."""
@@ -116,10 +462,10 @@ class ClimateRiskAnalyzer:
             "units": "metric"
         }
         try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            async with self._get_session().get(url, params=params) as response:
+                response.raise_for_status()
+                return orjson.loads(await response.read())
+        except (aiohttp.ClientError, orjson.JSONDecodeError) as e:
             logger.error(f"OpenWeather API error: {str(e)}")
             raise
 
@@ -139,248 +485,292 @@ class ClimateRiskAnalyzer:
         Returns:
             List[Dict]: List of identified risks with severity and recommendations
         """
-        try:
-            weather_data = await self.get_weather_data(lat, lon)
-        except Exception as e:
-            raise ValueError(f"Failed to analyze risks: {str(e)}")
+        risks = (await self.analyze_risks_batch([(lat, lon)]))[0]
+        return [risk.to_dict() for risk in risks]
 
-        risks = []
+    async def analyze_risks_batch(
+        self, coords: Sequence[tuple[float, float]], concurrency: int = DEFAULT_BATCH_CONCURRENCY
+    ) -> list[list[Risk]]:
+        """Analyze climate-related risks for many locations at once.
 
-        # Extract weather parameters from combined data
-        try:
-            current_weather = weather_data["current_weather"]
-            weather_data["severe_weather"]
-            weather_data["basic_weather"]
+        Weather and historical data are fetched concurrently, at most
+        ``concurrency`` locations at a time, then each threshold is evaluated as
+        a NumPy mask over the whole batch so scoring cost does not grow with
+        per-site Python branching.
+
+        Args:
+            coords (Sequence[Tuple[float, float]]): (lat, lon) pairs to analyze
+            concurrency (int): Maximum number of locations fetched at once
+
+        Returns:
+            List[List[Risk]]: Identified risks for each location, in input order
 
-            # Use OpenWeather data for current conditions
-            temp = current_weather.get("main", {}).get("temp")
-            humidity = current_weather.get("main", {}).get("humidity")
-            wind_speed = current_weather.get("wind", {}).get("speed")
-            rain_1h = current_weather.get("rain", {}).get("1h", 0)
-            weather_conditions = current_weather.get("weather", [])
+        Raises:
+            ValueError: If weather data for any location cannot be fetched or parsed
+        """
+        if not coords:
+            return []
+        if _event_counter is None:
+            await asyncio.to_thread(_load_event_counter)
+
+        semaphore = asyncio.Semaphore(concurrency)
 
-            # Get historical data for frequency analysis
-            historical_data = await self._get_historical_data(lat, lon)
+        async def fetch(lat: float, lon: float) -> list[dict]:
+            async with semaphore:
+                return await asyncio.gather(
+                    self.get_weather_data(lat, lon), self._get_historical_data(lat, lon)
+                )
 
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(fetch(lat, lon)) for lat, lon in coords]
+        except ExceptionGroup as eg:
+            raise ValueError(f"Failed to analyze risks: {str(eg.exceptions[0])}")
+        weather_batch, historical_batch = zip(*(task.result() for task in tasks))
+
+        # Extract weather parameters from combined data. Raw values are kept for
+        # the risk descriptions; missing or non-numeric readings become NaN in
+        # the arrays so every comparison against them is False.
+        readings = []
+        conditions = []
+        try:
+            for weather_data in weather_batch:
+                current_weather = weather_data["current_weather"]
+                main = current_weather.get("main", {})
+                readings.append((
+                    main.get("temp"),
+                    main.get("humidity"),
+                    current_weather.get("wind", {}).get("speed"),
+                    current_weather.get("rain", {}).get("1h", 0),
+                ))
+                conditions.append(current_weather.get("weather", []))
         except (KeyError, AttributeError) as e:
             raise ValueError(f"Invalid weather data format: {str(e)}")
 
+        temp, humidity, wind_speed, rain_1h = (
+            np.array([_as_reading(value) for value in column], dtype=np.float64)
+            for column in zip(*readings)
+        )
+
+        # Historical frequency of extreme events per location
+        frequent_heat = np.zeros(len(coords), dtype=bool)
+        frequent_floods = np.zeros(len(coords), dtype=bool)
+        for i, historical_data in enumerate(historical_batch):
+            event_counts = self._count_events(historical_data)
+            frequent_heat[i] = self._check_frequent_extreme_heat(event_counts)
+            frequent_floods[i] = self._check_frequent_100_year_floods(event_counts)
+
         # 1. Extreme Heat Risk (based on FEMA, WHO, and ISO standards)
-        if temp is not None:
-            heat_thresholds = self.thresholds["extreme_heat"]
-            # Check for frequent extreme heat events using NOAA data
-            frequent_extreme_heat = await self._check_frequent_extreme_heat(historical_data)
-            if frequent_extreme_heat:
-                risks.append({
-                    "type": "Extreme Heat",
-                    "severity": "Super Extreme",
-                    "description": "Frequent extreme heat events detected in the past five years",
-                    "sources": heat_thresholds["high"]["sources"],
-                    "recommendations": [
-                        "Immediate action required: Stay indoors, use air conditioning, and check on vulnerable individuals",
-                        "Contact local emergency services if necessary",
-                        "Review and update heat preparedness plans",
-                        "Consider long-term heat mitigation strategies"
-                    ]
-                })
-            elif temp > heat_thresholds["high"]["temperature"]:
-                risks.append({
-                    "type": "Extreme Heat",
-                    "severity": "High",
-                    "description": f"Extreme heat conditions detected ({temp}°C)",
-                    "sources": heat_thresholds["high"]["sources"],
-                    "recommendations": [
-                        "Stay hydrated and avoid outdoor activities during peak hours",
-                        "Check on vulnerable individuals",
-                        "Use air conditioning or cooling centers if available",
-                        "Monitor local heat advisories"
-                    ]
-                })
-            elif temp > heat_thresholds["medium"]["temperature"]:
-                risks.append({
-                    "type": "Extreme Heat",
-                    "severity": "Medium",
-                    "description": f"High temperature conditions detected ({temp}°C)",
-                    "sources": heat_thresholds["medium"]["sources"],
-                    "recommendations": [
-                        "Stay hydrated",
-                        "Limit outdoor activities during peak hours",
-                        "Monitor local weather updates"
-                    ]
-                })
+        heat_level = np.select(
+            [
+                ~np.isnan(temp) & frequent_heat,
+                temp > self._heat_high_temp,
+                temp > self._heat_medium_temp,
+            ],
+            [LEVEL_SUPER_EXTREME, LEVEL_HIGH, LEVEL_MEDIUM],
+            default=LEVEL_NONE,
+        )
 
         # 2. Flooding Risk (based on FEMA and ISO standards)
-        if rain_1h > 0:
-            flood_thresholds = self.thresholds["flooding"]
-            # Check for frequent 100-year flood events using NOAA data
-            frequent_100_year_floods = await self._check_frequent_100_year_floods(historical_data)
-            if frequent_100_year_floods:
-                risks.append({
-                    "type": "Flooding",
-                    "severity": "Super Extreme",
-                    "description": "Frequent 100-year flood events detected in the past five years",
-                    "sources": flood_thresholds["high"]["sources"],
-                    "recommendations": [
-                        "Immediate evacuation may be necessary",
-                        "Contact local emergency services",
-                        "Review and update flood preparedness plans",
-                        "Consider long-term flood mitigation strategies"
-                    ]
-                })
-            elif rain_1h > flood_thresholds["high"]["rainfall_1h"]:
-                risks.append({
-                    "type": "Flooding",
-                    "severity": "High",
-                    "description": f"Extreme rainfall detected ({rain_1h}mm in the last hour)",
-                    "sources": flood_thresholds["high"]["sources"],
-                    "recommendations": [
-                        "Move to higher ground if in a flood-prone area",
-                        "Avoid driving through flooded areas",
-                        "Stay informed about local flood warnings",
-                        "Follow evacuation orders if issued"
-                    ]
-                })
-            elif rain_1h > flood_thresholds["medium"]["rainfall_1h"]:
-                risks.append({
-                    "type": "Flooding",
-                    "severity": "Medium",
-                    "description": f"Heavy rainfall detected ({rain_1h}mm in the last hour)",
-                    "sources": flood_thresholds["medium"]["sources"],
-                    "recommendations": [
-                        "Be cautious in low-lying areas",
-                        "Monitor local weather updates",
-                        "Prepare for potential flooding"
-                    ]
-                })
+        flood_level = np.select(
+            [
+                (rain_1h > 0) & frequent_floods,
+                rain_1h > self._flood_high_rain,
+                rain_1h > self._flood_medium_rain,
+            ],
+            [LEVEL_SUPER_EXTREME, LEVEL_HIGH, LEVEL_MEDIUM],
+            default=LEVEL_NONE,
+        )
 
         # 3. Wildfire Risk (based on FEMA and ISO standards)
-        if temp is not None and humidity is not None and wind_speed is not None:
-            wildfire_thresholds = self.thresholds["wildfire"]
-            if (temp > wildfire_thresholds["high"]["temperature"] and
-                humidity < wildfire_thresholds["high"]["humidity"] and
-                wind_speed > wildfire_thresholds["high"]["wind_speed"]):
-                risks.append({
-                    "type": "Wildfire",
-                    "severity": "High",
-                    "description": f"High wildfire risk conditions: High temperature ({temp}°C), low humidity ({humidity}%), and strong winds ({wind_speed} m/s)",
-                    "sources": wildfire_thresholds["high"]["sources"],
-                    "recommendations": [
-                        "Avoid outdoor burning",
-                        "Be prepared for potential evacuation",
-                        "Monitor local fire warnings",
-                        "Have an evacuation plan ready"
-                    ]
-                })
-            elif (temp > wildfire_thresholds["medium"]["temperature"] and
-                  humidity < wildfire_thresholds["medium"]["humidity"] and
-                  wind_speed > wildfire_thresholds["medium"]["wind_speed"]):
-                risks.append({
-                    "type": "Wildfire",
-                    "severity": "Medium",
-                    "description": f"Moderate wildfire risk conditions: Elevated temperature ({temp}°C), low humidity ({humidity}%), and moderate winds ({wind_speed} m/s)",
-                    "sources": wildfire_thresholds["medium"]["sources"],
-                    "recommendations": [
-                        "Be cautious with outdoor activities",
-                        "Monitor local fire conditions",
-                        "Prepare for potential fire outbreaks"
-                    ]
-                })
-
-        # 4. Extreme Storms Risk (based on NOAA and ISO standards)
-        storm_thresholds = self.thresholds["extreme_storms"]
-        for condition in weather_conditions:
-            main = condition.get("main", "").lower()
-            if "thunderstorm" in main:
-                risks.append({
-                    "type": "Extreme Storms",
-                    "severity": "High",
-                    "description": "Thunderstorm conditions detected",
-                    "sources": storm_thresholds["high"]["sources"],
-                    "recommendations": [
-                        "Seek shelter immediately",
-                        "Stay away from windows and electrical equipment",
-                        "Monitor local storm warnings",
-                        "Follow emergency instructions"
-                    ]
-                })
-            elif "storm" in main:
-                risks.append({
-                    "type": "Extreme Storms",
-                    "severity": "Medium",
-                    "description": "Storm conditions detected",
-                    "sources": storm_thresholds["medium"]["sources"],
-                    "recommendations": [
-                        "Stay indoors if possible",
-                        "Monitor local weather updates",
-                        "Be prepared for power outages"
-                    ]
-                })
-
-        return risks
+        high_temp, high_humidity, high_wind = self._wildfire_high
+        medium_temp, medium_humidity, medium_wind = self._wildfire_medium
+        wildfire_level = np.select(
+            [
+                (temp > high_temp) & (humidity < high_humidity) & (wind_speed > high_wind),
+                (temp > medium_temp) & (humidity < medium_humidity) & (wind_speed > medium_wind),
+            ],
+            [LEVEL_HIGH, LEVEL_MEDIUM],
+            default=LEVEL_NONE,
+        )
+
+        results: list[list[Risk]] = [[] for _ in coords]
+        for i in np.flatnonzero(heat_level | flood_level | wildfire_level):
+            risks = results[i]
+            temp_i, humidity_i, wind_i, rain_i = readings[i]
+            if heat_level[i]:
+                risks.append(self._heat_risk(heat_level[i], temp_i))
+            if flood_level[i]:
+                risks.append(self._flood_risk(flood_level[i], rain_i))
+            if wildfire_level[i]:
+                risks.append(self._wildfire_risk(wildfire_level[i], temp_i, humidity_i, wind_i))
+
+        # 4. Extreme Storms Risk (based on NOAA and ISO standards). Only the most
+        # severe matching condition is reported; stop at the first High match.
+        for risks, weather_conditions in zip(results, conditions):
+            worst_storm = None
+            for condition in weather_conditions:
+                storm = _classify_storm(condition)
+                if storm and (worst_storm is None or storm[0] == "High"):
+                    worst_storm = storm
+                    if storm[0] == "High":
+                        break
+            if worst_storm:
+                risks.append(self._storm_risk(*worst_storm))
+
+        return results
+
+    def _heat_risk(self, level: int, temp: float) -> Risk:
+        """Build an Extreme Heat risk entry for the given level."""
+        if level == LEVEL_SUPER_EXTREME:
+            return Risk(
+                type="Extreme Heat",
+                severity="Super Extreme",
+                description="Frequent extreme heat events detected in the past five years",
+                sources=self._heat_high_sources,
+                recommendations=HEAT_SUPER_EXTREME_RECOMMENDATIONS
+            )
+        if level == LEVEL_HIGH:
+            return Risk(
+                type="Extreme Heat",
+                severity="High",
+                description=_describe(HEAT_HIGH_DESCRIPTION, temp),
+                sources=self._heat_high_sources,
+                recommendations=HEAT_HIGH_RECOMMENDATIONS
+            )
+        return Risk(
+            type="Extreme Heat",
+            severity="Medium",
+            description=_describe(HEAT_MEDIUM_DESCRIPTION, temp),
+            sources=self._heat_medium_sources,
+            recommendations=HEAT_MEDIUM_RECOMMENDATIONS
+        )
+
+    def _flood_risk(self, level: int, rain_1h: float) -> Risk:
+        """Build a Flooding risk entry for the given level."""
+        if level == LEVEL_SUPER_EXTREME:
+            return Risk(
+                type="Flooding",
+                severity="Super Extreme",
+                description="Frequent 100-year flood events detected in the past five years",
+                sources=self._flood_high_sources,
+                recommendations=FLOOD_SUPER_EXTREME_RECOMMENDATIONS
+            )
+        if level == LEVEL_HIGH:
+            return Risk(
+                type="Flooding",
+                severity="High",
+                description=_describe(FLOOD_HIGH_DESCRIPTION, rain_1h),
+                sources=self._flood_high_sources,
+                recommendations=FLOOD_HIGH_RECOMMENDATIONS
+            )
+        return Risk(
+            type="Flooding",
+            severity="Medium",
+            description=_describe(FLOOD_MEDIUM_DESCRIPTION, rain_1h),
+            sources=self._flood_medium_sources,
+            recommendations=FLOOD_MEDIUM_RECOMMENDATIONS
+        )
+
+    def _wildfire_risk(self, level: int, temp: float, humidity: float, wind_speed: float) -> Risk:
+        """Build a Wildfire risk entry for the given level."""
+        if level == LEVEL_HIGH:
+            return Risk(
+                type="Wildfire",
+                severity="High",
+                description=_describe(WILDFIRE_HIGH_DESCRIPTION, temp, humidity, wind_speed),
+                sources=self._wildfire_high_sources,
+                recommendations=WILDFIRE_HIGH_RECOMMENDATIONS
+            )
+        return Risk(
+            type="Wildfire",
+            severity="Medium",
+            description=_describe(WILDFIRE_MEDIUM_DESCRIPTION, temp, humidity, wind_speed),
+            sources=self._wildfire_medium_sources,
+            recommendations=WILDFIRE_MEDIUM_RECOMMENDATIONS
+        )
+
+    def _storm_risk(self, severity: str, description: str) -> Risk:
+        """Build an Extreme Storms risk entry for the given severity."""
+        if severity == "High":
+            sources, recommendations = self._storm_high_sources, STORM_HIGH_RECOMMENDATIONS
+        else:
+            sources, recommendations = self._storm_medium_sources, STORM_MEDIUM_RECOMMENDATIONS
+        return Risk(
+            type="Extreme Storms",
+            severity=severity,
+            description=description,
+            sources=sources,
+            recommendations=recommendations
+        )
 
     async def _get_historical_data(self, lat: float, lon: float) -> dict:
-        """Get historical weather data from NOAA."""
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=365 * 5)  # 5 years of data
-
+        """Get historical weather data from NOAA, cached per location."""
+        key = ("historical", round(lat, 3), round(lon, 3))
         try:
-            historical_data = await self.noaa_data.get_severe_weather_data(
-                start_date=start_date.strftime("%Y-%m-%d"),
-                end_date=end_date.strftime("%Y-%m-%d"),
-                location=f"{lat},{lon}",
-                data_type="all",
-                format="json"
+            return await self._cached_fetch(
+                self._historical_cache,
+                key,
+                HISTORICAL_CACHE_TTL,
+                lambda: self._fetch_historical_data(lat, lon),
             )
-
-            if historical_data["status"] == "error":
-                logger.warning(f"Failed to fetch historical data: {historical_data.get('error')}")
-                return {}
-
-            return historical_data["result"]
-
         except Exception as e:
             logger.error(f"Error fetching historical data: {str(e)}")
             return {}
 
-    async def _check_frequent_100_year_floods(self, historical_data: dict) -> bool:
-        """Check for frequent 100-year flood events in historical data."""
-        if not historical_data:
-            return False
+    async def _fetch_historical_data(self, lat: float, lon: float) -> dict:
+        """Fetch five years of NOAA severe weather history, bypassing the cache."""
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=365 * 5)  # 5 years of data
+        end_day = end_date.strftime("%Y-%m-%d")
+        start_day = start_date.strftime("%Y-%m-%d")
 
-        try:
-            # Analyze flood events from historical data
-            flood_events = [event for event in historical_data.get("events", [])
-                          if event.get("type") == "flood"]
+        historical_data = await self.noaa_data.get_severe_weather_data(
+            start_date=start_day,
+            end_date=end_day,
+            location=f"{lat},{lon}",
+            data_type="all",
+            format="json"
+        )
 
-            # Count significant flood events
-            significant_floods = sum(1 for event in flood_events
-                                  if event.get("severity", 0) >= 0.8)  # 80% of 100-year flood
+        if historical_data["status"] == "error":
+            raise RuntimeError(f"NOAA returned an error: {historical_data.get('error')}")
 
-            return significant_floods >= 2  # Two or more significant floods in 5 years
+        return historical_data["result"]
 
-        except Exception as e:
-            logger.error(f"Error checking flood frequency: {str(e)}")
-            return False
+    def _count_events(self, historical_data: dict) -> dict[str, int]:
+        """Count significant flood and extreme heat events in historical data.
 
-    async def _check_frequent_extreme_heat(self, historical_data: dict) -> bool:
-        """Check for frequent extreme heat events in historical data."""
-        if not historical_data:
-            return False
+        Event types are coded as small integers and severities loaded into a
+        NumPy array once; both counts then come from a single call to
+        ``_count_significant_events`` (Numba-compiled when available).
+        """
+        events = historical_data.get("events", []) if historical_data else []
+        if not events:
+            return {"flood": 0, "heat": 0}
 
         try:
-            # Analyze heat events from historical data
-            heat_events = [event for event in historical_data.get("events", [])
-                         if event.get("type") == "heat"]
+            types = np.fromiter(
+                (EVENT_TYPE_CODES.get(event.get("type"), EVENT_OTHER) for event in events),
+                dtype=np.int8, count=len(events)
+            )
+            severity = np.fromiter(
+                (event.get("severity", 0.0) for event in events), dtype=np.float64, count=len(events)
+            )
+        except (AttributeError, TypeError, ValueError) as e:
+            logger.error(f"Error counting historical events: {str(e)}")
+            return {"flood": 0, "heat": 0}
 
-            # Count extreme heat events
-            extreme_heat = sum(1 for event in heat_events
-                             if event.get("severity", 0) >= 0.9)  # 90th percentile
+        floods, heat = _count_significant_events(types, severity)
+        return {"flood": floods, "heat": heat}
 
-            return extreme_heat >= 3  # Three or more extreme heat events in 5 years
+    def _check_frequent_100_year_floods(self, event_counts: dict[str, int]) -> bool:
+        """Check for frequent 100-year flood events in historical data."""
+        return event_counts["flood"] >= FREQUENT_FLOOD_COUNT
 
-        except Exception as e:
-            logger.error(f"Error checking heat frequency: {str(e)}")
-            return False
+    def _check_frequent_extreme_heat(self, event_counts: dict[str, int]) -> bool:
+        """Check for frequent extreme heat events in historical data."""
+        return event_counts["heat"] >= FREQUENT_HEAT_COUNT
 
 async def main():
     """Example usage of the ClimateRiskAnalyzer."""
@@ -414,7 +804,9 @@ async def main():
 
     except Exception as e:
         print(f"Error during analysis: {str(e)}")
+    finally:
+        await analyzer.close()
 
 if __name__ == "__main__":
-    import asyncio
+    logging.basicConfig(level=logging.INFO)
     asyncio.run(main())
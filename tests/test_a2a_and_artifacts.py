@@ -8,6 +8,10 @@ Covers:
 - Router and task manager
 - Error handling in A2A
 """
+import json
+import os
+
+import orjson
 import pytest
 import asyncio
 from datetime import datetime, timedelta, timezone
@@ -18,8 +22,10 @@ from multi_agent_system.a2a.message import (
 )
 from multi_agent_system.a2a.multipart import A2AMultiPartMessage
 from multi_agent_system.a2a.parts import A2APart
-from multi_agent_system.a2a.artifacts import A2AArtifact, ArtifactMetadata
-from multi_agent_system.a2a.artifact_manager import A2AArtifactManager
+from multi_agent_system.a2a.artifacts import A2AArtifact, ArtifactMetadata, ArtifactStatus, ArtifactType
+from multi_agent_system.a2a.artifact_manager import A2AArtifactManager, ArtifactNotFoundError
+from multi_agent_system import artifact_manager as fs_artifact_manager
+from multi_agent_system.artifact_manager import ArtifactManager
 from multi_agent_system.a2a.task_manager import TaskState
 from multi_agent_system.a2a.router import A2AMessageRouter
 from multi_agent_system.a2a.enums import MessageType, Priority, StatusCode, PartType
@@ -109,6 +115,163 @@ class TestA2AArtifacts:
         artifact.expires_at = datetime.now(timezone.utc) - timedelta(days=1)
         assert artifact.is_expired()
 
+    def test_artifact_manager_round_trip(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        manager = A2AArtifactManager(storage_path="store", db_path="artifacts.db")
+        metadata = ArtifactMetadata(
+            title="Flood Report",
+            description="Test artifact for storage",
+            author="test_author",
+            tags=["flood", "gulf"]
+        )
+        artifact = A2AArtifact(id="art3", content={"risk": "flood"}, metadata=metadata)
+        manager.store_artifact(artifact)
+        manager.clear_cache()
+
+        assert manager.retrieve_artifact("art3").content == {"risk": "flood"}
+        assert [a.id for a in manager.search_artifacts(tags=["flood", "gulf"])] == ["art3"]
+        assert manager.search_artifacts(tags=["drought"]) == []
+        manager.close()
+
+
+def _stored_artifact(artifact_id, content, author="test_author", tags=None, **kwargs):
+    metadata = ArtifactMetadata(
+        title=f"Artifact {artifact_id}",
+        description="Test artifact for storage",
+        author=author,
+        tags=tags or []
+    )
+    return A2AArtifact(id=artifact_id, content=content, metadata=metadata, **kwargs)
+
+
+@pytest.mark.unit
+class TestA2AArtifactManager:
+    @pytest.fixture
+    def manager(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        manager = A2AArtifactManager(storage_path="store", db_path="artifacts.db")
+        yield manager
+        manager.close()
+
+    def test_soft_delete_only_marks_status(self, manager):
+        manager.store_artifact(_stored_artifact("kept", {"v": 1}))
+        manager.store_artifact(_stored_artifact("gone", {"v": 2}))
+        assert manager.delete_artifact("gone")
+
+        deleted = manager.retrieve_artifact("gone")
+        assert deleted.status == ArtifactStatus.DELETED
+        manager.clear_cache()
+        assert manager.retrieve_artifact("gone").content == {"v": 2}
+        assert sorted(a.id for a in manager.search_artifacts()) == ["gone", "kept"]
+        assert [a.id for a in manager.search_artifacts(status=ArtifactStatus.DELETED)] == ["gone"]
+
+    def test_import_rolls_back_only_the_failing_artifact(self, manager, tmp_path):
+        exported = [_stored_artifact(f"imp{i}", {"i": i}).to_dict() for i in range(3)]
+        # A non-string tag passes validation but cannot be bound as an
+        # artifact_tags parameter, so the second artifact fails after its
+        # artifacts/versions/permissions rows are written
+        exported[1]["metadata"]["tags"] = [{"not": "a tag"}]
+        import_file = tmp_path / "import.json"
+        import_file.write_text(json.dumps({"artifacts": exported}, default=str))
+
+        assert manager.import_artifacts(str(import_file)) == ["imp0", "imp2"]
+
+        manager.clear_cache()
+        assert manager.retrieve_artifact("imp2").content == {"i": 2}
+        with pytest.raises(ArtifactNotFoundError):
+            manager.retrieve_artifact("imp1")
+        assert manager._conn.execute(
+            "SELECT COUNT(*) FROM artifact_versions WHERE artifact_id = 'imp1'"
+        ).fetchone()[0] == 0
+        assert not manager._conn.in_transaction
+
+    def test_tag_search_is_exact_and_backfilled(self, manager):
+        manager.store_artifact(_stored_artifact("tagged", {"v": 1}, tags=["flood", "gulf"]))
+
+        # Tags match exactly: no case folding and no substring matches
+        assert [a.id for a in manager.search_artifacts(tags=["flood"])] == ["tagged"]
+        assert manager.search_artifacts(tags=["Flood"]) == []
+        assert manager.search_artifacts(tags=["floo"]) == []
+
+        # A database from before artifact_tags existed is backfilled on open
+        manager._conn.execute("DROP TABLE artifact_tags")
+        manager._conn.commit()
+        manager.close()
+        reopened = A2AArtifactManager(storage_path="store", db_path="artifacts.db")
+        try:
+            assert [a.id for a in reopened.search_artifacts(tags=["gulf"])] == ["tagged"]
+        finally:
+            reopened.close()
+
+    def test_cache_evicts_least_recently_used(self, manager):
+        manager._cache_size = 2
+        for artifact_id in ("a", "b"):
+            manager.store_artifact(_stored_artifact(artifact_id, {"id": artifact_id}))
+        manager.retrieve_artifact("a")
+        manager.store_artifact(_stored_artifact("c", {"id": "c"}))
+
+        assert list(manager._cache) == ["a", "c"]
+
+    def test_search_records_one_access_time_in_cache_and_db(self, manager):
+        for artifact_id in ("s1", "s2"):
+            manager.store_artifact(_stored_artifact(artifact_id, {"id": artifact_id}))
+
+        found = manager.search_artifacts()
+        assert len({a.metadata.accessed_at for a in found}) == 1
+        stamped = found[0].metadata.accessed_at.isoformat()
+        rows = manager._conn.execute("SELECT accessed_at, access_count FROM artifacts").fetchall()
+        assert [(row["accessed_at"], row["access_count"]) for row in rows] == [(stamped, 1)] * 2
+
+    def test_statistics_group_counts_and_current_version_size(self, manager):
+        first = _stored_artifact("r1", {"text": "short"}, author="alice")
+        second = _stored_artifact("r2", {"text": "a bit longer"}, author="bob")
+        recommendation = _stored_artifact(
+            "rec", {"advice": "move"}, author="alice", artifact_type=ArtifactType.RECOMMENDATION
+        )
+        for artifact in (first, second, recommendation):
+            manager.store_artifact(artifact)
+        updated = manager.update_artifact("r1", {"content": {"text": "replaced with longer text"}}, "alice")
+
+        stats = manager.get_artifact_statistics()
+        sizes = [updated.metadata.size, second.metadata.size, recommendation.metadata.size]
+        assert stats["total_artifacts"] == 3
+        assert stats["by_type"] == {"report": 2, "recommendation": 1}
+        assert stats["by_status"] == {"draft": 3}
+        assert stats["by_author"] == {"alice": 2, "bob": 1}
+        assert stats["storage"] == {"total_size": sum(sizes), "average_size": sum(sizes) / 3}
+
+
+@pytest.mark.unit
+class TestArtifactManagerCache:
+    @pytest.mark.asyncio
+    async def test_listing_cache_follows_file_mtime(self, tmp_path):
+        manager = ArtifactManager(base_dir=str(tmp_path))
+        path = await manager.store_artifact("s1", "risk", "analysis", {"level": "high"})
+        assert [a["type"] for a in await manager.list_artifacts()] == ["analysis"]
+
+        # Rewriting the file with a newer mtime invalidates the cached entry
+        artifact = orjson.loads(open(path, "rb").read())
+        artifact["type"] = "report"
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(artifact))
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert [a["type"] for a in await manager.list_artifacts()] == ["report"]
+        assert (await manager.get_artifact_stats("s1"))["by_type"]["report"]["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded_and_reads_are_independent(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(fs_artifact_manager, "MAX_CACHED_ARTIFACTS", 1)
+        manager = ArtifactManager(base_dir=str(tmp_path))
+        path = await manager.store_artifact("s1", "risk", "analysis", {"level": "high"})
+        await manager.store_artifact("s1", "risk", "report", {"level": "low"})
+        assert len(await manager.list_artifacts()) == 2
+        assert len(manager._artifact_cache) == 1
+
+        first = await manager.get_artifact(path)
+        first["data"]["level"] = "mutated"
+        assert (await manager.get_artifact(path))["data"]["level"] == "high"
+
 
 @pytest.mark.unit
 class TestA2AParts:
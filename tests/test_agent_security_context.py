@@ -6,7 +6,7 @@ import logging
 import pytest
 from datetime import datetime
 
-from multi_agent_system.agents.base_agent import SecurityContext, ErrorContext
+from multi_agent_system.agents.base_agent import AuditLogger, ErrorContext, ErrorHandler, SecurityContext
 
 logger = logging.getLogger(__name__)
 
@@ -33,3 +33,42 @@ def test_error_context_fields():
     assert err.stack_trace == "trace"
     assert err.context_data["key"] == "val"
     logger.info("ErrorContext fields validated")
+
+
+@pytest.mark.unit
+def test_audit_logger_retention_spills_oldest():
+    spilled = []
+    audit = AuditLogger(max_events=2, spill=spilled.append)
+    for i in range(4):
+        audit.log_request(request_id=f"req{i}", user_id="user1", action="read", details={})
+    assert [e.request_id for e in audit.audit_events] == ["req2", "req3"]
+    assert [e.request_id for e in spilled] == ["req0", "req1"]
+    stats = audit.get_stats()
+    assert stats == {"total_events": 4, "events_by_type": {"read": 4}}
+    assert type(stats["events_by_type"]) is dict
+    stats["events_by_type"]["read"] = 0
+    assert audit.get_stats()["events_by_type"] == {"read": 4}
+    latest = audit.audit_events[-1].to_dict()
+    assert latest["action"] == "read"
+    assert datetime.fromisoformat(latest["timestamp"]) <= datetime.now()
+    assert [e.request_id for e in audit.get_events(offset=1, limit=5)] == ["req3"]
+    logger.info("AuditLogger retention validated")
+
+
+@pytest.mark.unit
+def test_zero_retention_with_spill_keeps_nothing():
+    spilled = []
+    audit = AuditLogger(max_events=0, spill=spilled.append)
+    audit.log_request(request_id="req0", user_id="user1", action="read", details={})
+    assert not audit.audit_events
+    assert audit.get_stats()["total_events"] == 1
+
+    errors = ErrorHandler(max_errors=0, spill=spilled.append)
+    errors.handle_error(ErrorContext("ValueError", "E1", "bad", datetime.now()))
+    assert not errors.errors
+    assert errors.get_error_stats() == {
+        "total_errors": 1,
+        "errors_by_type": {"ValueError": 1},
+        "errors_by_code": {"E1": 1},
+    }
+    assert spilled == []
@@ -14,6 +14,8 @@ import asyncio
 from unittest.mock import Mock, patch, AsyncMock
 from datetime import datetime
 
+import orjson
+
 from multi_agent_system.agents.base_agent import BaseAgent
 from multi_agent_system.agents.risk_agent import RiskAnalyzerAgent
 from multi_agent_system.agents.historical_agent import HistoricalAnalyzerAgent
@@ -21,6 +23,7 @@ from multi_agent_system.agents.recommendation_agent import RecommendationAgent
 from multi_agent_system.agents.validation_agent import ValidationAgent
 from multi_agent_system.agents.tools import get_weather_data, analyze_climate_risk
 from multi_agent_system.agent_team import AgentTeam
+from multi_agent_system import session_manager as session_manager_module
 from multi_agent_system.session_manager import SessionManager
 from multi_agent_system.coordinator import CoordinatorAgent
 
@@ -327,6 +330,35 @@ class TestSessionManagement:
         # For now, just verify the session was created successfully
         assert session.session_id == session_id
 
+    @pytest.mark.asyncio
+    async def test_session_update_durability(self, tmp_path, monkeypatch):
+        """Updates are on disk on return unless coalesced; flush() and stop() write coalesced ones."""
+        session_manager = SessionManager(storage_dir=str(tmp_path))
+        await session_manager.create_session(location="Mobile", session_id="durable")
+        path = tmp_path / "durable.json"
+
+        def stored_agents():
+            return orjson.loads(path.read_bytes())["agent_states"]
+
+        await session_manager.update_session("durable", "risk", {"status": "ok"})
+        assert "risk" in stored_agents()
+
+        await session_manager.update_session("durable", "news", {"status": "ok"}, coalesce=True)
+        assert "news" not in stored_agents()
+        await session_manager.flush()
+        assert "news" in stored_agents()
+
+        # A failed flush raises and keeps the update pending for the next write
+        await session_manager.update_session("durable", "history", {"status": "ok"}, coalesce=True)
+        with monkeypatch.context() as m:
+            m.setattr(session_manager_module, "write_atomic", Mock(side_effect=OSError("disk full")))
+            with pytest.raises(OSError):
+                await session_manager.flush()
+        assert "history" not in stored_agents()
+
+        await session_manager.stop()
+        assert "history" in stored_agents()
+
 
 @pytest.mark.unit
 class TestCoordinator:
@@ -7,8 +7,13 @@ Covers:
 - Data validation and transformation
 - Utility functions
 """
+import asyncio
+import threading
+
+import numpy as np
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
+from multi_agent_system import weather_risks
 from multi_agent_system.data_management import DataManager
 from multi_agent_system.data.weather_data import NOAAWeatherData
 from multi_agent_system.data.nature_based_solutions_source import NatureBasedSolutionsSource
@@ -55,6 +60,20 @@ class TestWeatherAndNBS:
             assert result[0]["name"] == "Tree Planting"
             mock_get.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_noaa_sessions_are_per_thread_and_closed(self, tmp_path):
+        noaa = NOAAWeatherData(cache_dir=str(tmp_path / "cache"))
+        main_session = noaa.session
+        worker_session = await asyncio.to_thread(lambda: noaa.session)
+        assert main_session is noaa.session and worker_session is not main_session
+
+        with patch.object(main_session, "close") as main_close, \
+                patch.object(worker_session, "close") as worker_close:
+            noaa.close()
+        main_close.assert_called_once()
+        worker_close.assert_called_once()
+        assert noaa.session is not main_session
+
 
 @pytest.mark.unit
 class TestDataValidationAndTransformation:
@@ -74,6 +93,163 @@ class TestDataValidationAndTransformation:
             assert result["transformed"] is True
             mock_trans.assert_called_once()
 
+def _current_weather(temp=None, humidity=None, wind=None, rain=None, conditions=()):
+    """Combined weather data carrying only the given OpenWeather readings."""
+    main = {k: v for k, v in (("temp", temp), ("humidity", humidity)) if v is not None}
+    current = {"main": main, "weather": list(conditions)}
+    if wind is not None:
+        current["wind"] = {"speed": wind}
+    if rain is not None:
+        current["rain"] = {"1h": rain}
+    return {"current_weather": current, "severe_weather": {}, "basic_weather": {}}
+
+
+@pytest.mark.unit
+class TestWeatherRiskAnalysis:
+    TYPES = np.array([1, 1, 2, 2, 2, 0], dtype=np.int8)
+    SEVERITY = np.array([0.8, 0.5, 0.95, 0.9, 0.1, 1.0])
+
+    @pytest.fixture
+    def analyzer(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        return weather_risks.ClimateRiskAnalyzer(openweather_api_key="test")
+
+    def test_event_counter_numpy_fallback(self, monkeypatch):
+        monkeypatch.setattr(weather_risks, "NUMBA_AVAILABLE", False)
+        monkeypatch.setattr(weather_risks, "_event_counter", None)
+        assert weather_risks._load_event_counter() is weather_risks._count_with_numpy
+        assert weather_risks._count_significant_events(self.TYPES, self.SEVERITY) == (1, 2)
+
+    def test_event_counter_numba_kernel(self, monkeypatch):
+        pytest.importorskip("numba")
+        monkeypatch.setattr(weather_risks, "NUMBA_AVAILABLE", True)
+        monkeypatch.setattr(weather_risks, "_event_counter", None)
+        counter = weather_risks._load_event_counter()
+        assert counter.py_func is weather_risks._count_with_loop
+        assert weather_risks._count_significant_events(self.TYPES, self.SEVERITY) == (1, 2)
+
+    @pytest.mark.asyncio
+    async def test_event_counter_is_loaded_off_the_event_loop(self, analyzer, monkeypatch):
+        loaded_on = []
+
+        def load():
+            loaded_on.append(threading.get_ident())
+            weather_risks._event_counter = weather_risks._count_with_numpy
+            return weather_risks._event_counter
+
+        monkeypatch.setattr(weather_risks, "_event_counter", None)
+        monkeypatch.setattr(weather_risks, "_load_event_counter", load)
+        monkeypatch.setattr(
+            analyzer, "get_weather_data", AsyncMock(return_value={"current_weather": {}})
+        )
+        monkeypatch.setattr(analyzer, "_get_historical_data", AsyncMock(return_value={}))
+        assert await analyzer.analyze_risks_batch([(40.0, -74.0)]) == [[]]
+        assert loaded_on and loaded_on[0] != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_risks_are_hashable_and_dicts_keep_list_fields(self, analyzer, monkeypatch):
+        monkeypatch.setattr(analyzer, "get_weather_data", AsyncMock(return_value=_current_weather(temp=36)))
+        monkeypatch.setattr(analyzer, "_get_historical_data", AsyncMock(return_value={}))
+        (risk,), (again,) = await analyzer.analyze_risks_batch([(40.0, -74.0), (41.0, -73.0)])
+        assert isinstance(risk.sources, tuple)
+        assert risk == again and hash(risk) == hash(again)
+        as_dict = risk.to_dict()
+        assert isinstance(as_dict["sources"], list) and isinstance(as_dict["recommendations"], list)
+
+    async def _score(self, analyzer, monkeypatch, weather, historical=None):
+        monkeypatch.setattr(analyzer, "get_weather_data", AsyncMock(return_value=weather))
+        monkeypatch.setattr(analyzer, "_get_historical_data", AsyncMock(return_value=historical or {}))
+        return [
+            (risk["type"], risk["severity"], risk["description"])
+            for risk in await analyzer.analyze_risks(40.0, -74.0)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_single_site_matches_threshold_rules(self, analyzer, monkeypatch):
+        # Heat 35/30 degC, flood 50/25 mm, wildfire (35, 30%, 30) / (30, 40%, 20)
+        assert await self._score(analyzer, monkeypatch, _current_weather(
+            temp=36, humidity=20, wind=31, rain=60, conditions=[{"id": 211, "main": "Thunderstorm"}]
+        )) == [
+            ("Extreme Heat", "High", "Extreme heat conditions detected (36°C)"),
+            ("Flooding", "High", "Extreme rainfall detected (60mm in the last hour)"),
+            ("Wildfire", "High",
+             "High wildfire risk conditions: High temperature (36°C), low humidity (20%), "
+             "and strong winds (31 m/s)"),
+            ("Extreme Storms", "High", "Thunderstorm conditions detected"),
+        ]
+        assert await self._score(analyzer, monkeypatch, _current_weather(
+            temp=31, humidity=35, wind=25, rain=30, conditions=[{"main": "Storm"}]
+        )) == [
+            ("Extreme Heat", "Medium", "High temperature conditions detected (31°C)"),
+            ("Flooding", "Medium", "Heavy rainfall detected (30mm in the last hour)"),
+            ("Wildfire", "Medium",
+             "Moderate wildfire risk conditions: Elevated temperature (31°C), low humidity (35%), "
+             "and moderate winds (25 m/s)"),
+            ("Extreme Storms", "Medium", "Storm conditions detected"),
+        ]
+        # Thresholds are strict: exactly 35 degC is only Medium, 25 mm is no risk
+        assert await self._score(analyzer, monkeypatch, _current_weather(temp=35, rain=25)) == [
+            ("Extreme Heat", "Medium", "High temperature conditions detected (35°C)"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_frequent_history_escalates_to_super_extreme(self, analyzer, monkeypatch):
+        history = {"events": [{"type": "heat", "severity": 0.95}] * 3
+                   + [{"type": "flood", "severity": 0.9}] * 2}
+        assert await self._score(analyzer, monkeypatch, _current_weather(temp=20, rain=1), history) == [
+            ("Extreme Heat", "Super Extreme", "Frequent extreme heat events detected in the past five years"),
+            ("Flooding", "Super Extreme", "Frequent 100-year flood events detected in the past five years"),
+        ]
+        # Frequent history alone is not a risk without a temperature reading or rainfall
+        assert await self._score(analyzer, monkeypatch, _current_weather(rain=0), history) == []
+
+    @pytest.mark.asyncio
+    async def test_missing_and_non_numeric_readings_are_ignored(self, analyzer, monkeypatch):
+        assert await self._score(analyzer, monkeypatch, _current_weather()) == []
+        assert await self._score(analyzer, monkeypatch, _current_weather(
+            temp="n/a", humidity=20, wind=31, rain=float("nan")
+        )) == []
+        assert await self._score(analyzer, monkeypatch, _current_weather(
+            temp=40, humidity=None, wind=31
+        )) == [("Extreme Heat", "High", "Extreme heat conditions detected (40°C)")]
+
+    @pytest.mark.asyncio
+    async def test_stale_weather_served_when_refresh_fails(self, analyzer, monkeypatch):
+        monkeypatch.setattr(weather_risks, "CURRENT_CACHE_TTL", -1)
+        fetch = AsyncMock(return_value=_current_weather(temp=36))
+        monkeypatch.setattr(analyzer, "_fetch_weather_data", fetch)
+        monkeypatch.setattr(analyzer, "_get_historical_data", AsyncMock(return_value={}))
+
+        first = await analyzer.get_weather_data(40.0, -74.0)
+        fetch.side_effect = RuntimeError("upstream down")
+        assert await analyzer.get_weather_data(40.0, -74.0) is first
+        assert fetch.await_count == 2
+
+        with pytest.raises(ValueError, match="upstream down"):
+            await analyzer.analyze_risks(10.0, 10.0)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_fetch(self, analyzer, monkeypatch):
+        release = asyncio.Event()
+        calls = []
+
+        async def fetch(lat, lon):
+            calls.append((lat, lon))
+            await release.wait()
+            return _current_weather(temp=31)
+
+        monkeypatch.setattr(analyzer, "_fetch_weather_data", fetch)
+        monkeypatch.setattr(analyzer, "_get_historical_data", AsyncMock(return_value={}))
+        batch = asyncio.create_task(analyzer.analyze_risks_batch([(40.0, -74.0)] * 3))
+        single = asyncio.create_task(analyzer.get_weather_data(40.0, -74.0))
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await batch
+        assert calls == [(40.0, -74.0)]
+        assert (await single)["current_weather"]["main"]["temp"] == 31
+        assert [[risk.severity for risk in risks] for risks in results] == [["Medium"]] * 3
+
 def test_import_risk_definitions():
     from multi_agent_system.risk_definitions import RiskLevel, RiskThreshold
     rl = RiskLevel(name="Test", description="Test risk level")